@@ -1,16 +1,114 @@
 #!/usr/bin/env python
-"""Simple script to test starting services"""
+"""
+Run the auth and catalog services side by side.
+
+By default both uvicorn servers share a single event loop. Pass --reload to
+run each service as a separate `uvicorn --reload` process instead (code
+reloading needs uvicorn's own process supervisor); reload is only honoured
+when ENV=dev.
+
+Servers run on uvloop with the httptools HTTP parser where available.
+"""
+import argparse
+import asyncio
+import os
+import select
+import socket
 import subprocess
-import time
 import sys
+import time
 from pathlib import Path
 
+import uvicorn
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
 project_root = Path(__file__).parent
-auth_service = None
-catalog_service = None
+
+LOOP = "uvloop" if uvloop is not None else "asyncio"
+HTTP = "httptools"
+
+SERVICES = [
+    ("Auth", "services.auth.src.main:app", "127.0.0.1", 8001),
+    ("Catalog", "services.catalog.src.main:app", "127.0.0.1", 8000),
+]
+
+
+def build_server(app_path: str, host: str, port: int) -> uvicorn.Server:
+    config = uvicorn.Config(app_path, host=host, port=port, loop=LOOP, http=HTTP)
+    return uvicorn.Server(config)
+
+
+async def wait_until_started(name: str, server: uvicorn.Server, task: asyncio.Task) -> None:
+    print(f"Starting {name} Service...")
+    while not server.started:
+        if task.done():
+            raise RuntimeError(f"{name} service failed to start. See logs above.")
+        await asyncio.sleep(0.05)
+    print(f"✓ {name} service started")
+
+
+def print_banner() -> None:
+    print("\n" + "="*60)
+    print("EST Backend - Service Startup Test")
+    print("="*60)
+    print()
+
+
+def print_running() -> None:
+    print()
+    print("="*60)
+    print("Services Running!")
+    print("="*60)
+    print()
+    print("Auth Service:     http://localhost:8001/docs")
+    print("Catalog Service:  http://localhost:8000/docs")
+    print()
+    print("Press Ctrl+C to stop services...")
+    print()
 
 
-def start_service(name: str, app_path: str, host: str, port: int) -> subprocess.Popen:
+# ========== In-process mode ==========
+
+async def serve_in_process() -> None:
+    servers = [(name, build_server(app_path, host, port)) for name, app_path, host, port in SERVICES]
+    tasks = [asyncio.create_task(server.serve(), name=name) for name, server in servers]
+
+    try:
+        for (name, server), task in zip(servers, tasks):
+            await wait_until_started(name, server, task)
+
+        print_running()
+
+        # uvicorn traps SIGINT/SIGTERM itself; once any server stops
+        # (signal or crash), bring the others down with it
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for _, server in servers:
+            server.should_exit = True
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# ========== Subprocess mode (--reload) ==========
+
+def wait_for_port(name: str, proc: subprocess.Popen, host: str, port: int, timeout: float = 30.0) -> None:
+    """Poll the service port until it accepts TCP connections"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"{name} service failed to start. See logs above.")
+        try:
+            with socket.create_connection((host, port), timeout=0.1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"{name} service did not start listening on port {port}")
+
+
+def start_service_process(name: str, app_path: str, host: str, port: int) -> subprocess.Popen:
     print(f"Starting {name} Service on port {port}...")
     proc = subprocess.Popen(
         [
@@ -18,66 +116,102 @@ def start_service(name: str, app_path: str, host: str, port: int) -> subprocess.
             app_path,
             "--host", host,
             "--port", str(port),
+            "--loop", LOOP,
+            "--http", HTTP,
             "--reload",
         ],
         cwd=str(project_root),
         stdout=None,
         stderr=None,
     )
-    time.sleep(2)
-    if proc.poll() is not None:
-        raise RuntimeError(f"{name} service failed to start. See logs above.")
+    try:
+        wait_for_port(name, proc, host, port)
+    except RuntimeError:
+        proc.terminate()
+        raise
     print(f"✓ {name} service started (PID: {proc.pid})")
     return proc
 
 
-try:
-    print("\n" + "="*60)
-    print("EST Backend - Service Startup Test")
-    print("="*60)
-    print()
+def wait_for_first_exit(procs: list[subprocess.Popen]) -> subprocess.Popen:
+    """Block until any child exits and return it"""
+    if hasattr(os, "pidfd_open"):
+        # Linux: a pidfd becomes readable when its process exits, so a single
+        # select() supervises every child with no periodic wake-ups
+        fds = {os.pidfd_open(proc.pid): proc for proc in procs}
+        try:
+            readable, _, _ = select.select(list(fds), [], [])
+            exited = fds[readable[0]]
+            exited.poll()  # reap the child so returncode is populated
+            return exited
+        finally:
+            for fd in fds:
+                os.close(fd)
 
-    # Start auth service
-    auth_service = start_service("Auth", "services.auth.src.main:app", "127.0.0.1", 8001)
+    while True:
+        for proc in procs:
+            if proc.poll() is not None:
+                return proc
+        time.sleep(0.5)
 
-    time.sleep(1)
 
-    # Start catalog service
-    catalog_service = start_service("Catalog", "services.catalog.src.main:app", "127.0.0.1", 8000)
+def stop_processes(procs: list[tuple[str, subprocess.Popen]]) -> None:
+    for name, proc in procs:
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        print(f"✓ {name} service stopped")
 
-    print()
-    print("="*60)
-    print("Services Running!")
-    print("="*60)
-    print()
-    print("Auth Service:     http://localhost:8001/docs")
-    print("Catalog Service:  http://localhost:8000/docs")
-    print()
-    print("Press Ctrl+C to stop services...")
-    print()
 
-    # Wait for keyboard interrupt
-    auth_service.wait()
+def serve_subprocesses() -> None:
+    procs: list[tuple[str, subprocess.Popen]] = []
+    try:
+        for name, app_path, host, port in SERVICES:
+            procs.append((name, start_service_process(name, app_path, host, port)))
 
-except KeyboardInterrupt:
-    print("\n\nShutting down services...")
-    if auth_service:
-        auth_service.terminate()
-        auth_service.wait(timeout=5)
-        print("✓ Auth service stopped")
+        print_running()
 
-    if catalog_service:
-        catalog_service.terminate()
-        catalog_service.wait(timeout=5)
-        print("✓ Catalog service stopped")
+        exited = wait_for_first_exit([proc for _, proc in procs])
+        name = next(n for n, p in procs if p is exited)
+        print(f"\n{name} service exited with code {exited.returncode}")
+    except KeyboardInterrupt:
+        print("\n\nShutting down services...")
+    finally:
+        stop_processes(procs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--reload",
+        action="store_true",
+        help="run each service as a uvicorn --reload subprocess",
+    )
+    args = parser.parse_args()
+
+    if args.reload and os.getenv("ENV", "dev") != "dev":
+        print("--reload is only available with ENV=dev; starting without it")
+        args.reload = False
+
+    print_banner()
+    try:
+        if args.reload:
+            serve_subprocesses()
+        else:
+            # Server.serve() runs on the caller's loop, so pick uvloop here
+            run = uvloop.run if uvloop is not None else asyncio.run
+            run(serve_in_process())
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"\nERROR: {e}")
+        sys.exit(1)
 
     print("\nServices stopped.")
-    sys.exit(0)
-
-except Exception as e:
-    print(f"\nERROR: {e}")
-    if auth_service:
-        auth_service.terminate()
-    if catalog_service:
-        catalog_service.terminate()
-    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""Drop idx_users_email, which duplicates the unique_users_email index
+
+Revision ID: drop_users_email_index
+Revises: drop_verif_tokens_used_index
+Create Date: 2024-01-15 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = 'drop_users_email_index'
+down_revision = 'drop_verif_tokens_used_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The UNIQUE constraint already maintains a btree on email; emails are
+    # lowercased before they reach the database, so no lower(email) index either
+    op.drop_index('idx_users_email', table_name='users')
+
+
+def downgrade() -> None:
+    op.create_index('idx_users_email', 'users', ['email'], unique=False)
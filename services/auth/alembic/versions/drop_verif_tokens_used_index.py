@@ -0,0 +1,24 @@
+"""Drop the boolean index on verification_tokens.used
+
+Revision ID: drop_verif_tokens_used_index
+Revises: hash_verification_tokens
+Create Date: 2024-01-15 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = 'drop_verif_tokens_used_index'
+down_revision = 'hash_verification_tokens'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Token lookups go through the token_hash primary key, and no query
+    # filters on `used` alone, so this low-selectivity index only costs writes
+    op.drop_index('idx_verification_tokens_used', table_name='verification_tokens')
+
+
+def downgrade() -> None:
+    op.create_index('idx_verification_tokens_used', 'verification_tokens', ['used'], unique=False)
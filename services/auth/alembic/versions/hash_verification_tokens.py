@@ -0,0 +1,42 @@
+"""Store SHA-256 digests of verification tokens instead of the tokens
+
+Revision ID: hash_verification_tokens
+Revises: create_auth_tables
+Create Date: 2024-01-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'hash_verification_tokens'
+down_revision = 'create_auth_tables'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('verification_tokens', sa.Column('token_hash', sa.LargeBinary(32), nullable=True))
+    # Outstanding tokens keep working: hash them in place
+    op.execute("UPDATE verification_tokens SET token_hash = sha256(convert_to(token, 'UTF8'))")
+
+    # On a table built by create_auth_tables the primary key itself is named
+    # unique_verification_tokens_token, so only one of these may exist
+    op.execute('ALTER TABLE verification_tokens DROP CONSTRAINT IF EXISTS unique_verification_tokens_token')
+    op.execute('ALTER TABLE verification_tokens DROP CONSTRAINT IF EXISTS verification_tokens_pkey')
+    op.drop_column('verification_tokens', 'token')
+
+    op.alter_column('verification_tokens', 'token_hash', nullable=False)
+    op.create_primary_key('verification_tokens_pkey', 'verification_tokens', ['token_hash'])
+
+
+def downgrade() -> None:
+    # Digests cannot be turned back into tokens; pending verifications are dropped
+    op.execute("DELETE FROM verification_tokens")
+
+    op.drop_constraint('verification_tokens_pkey', 'verification_tokens', type_='primary')
+    op.drop_column('verification_tokens', 'token_hash')
+
+    op.add_column('verification_tokens', sa.Column('token', sa.String(255), nullable=False))
+    op.create_primary_key('verification_tokens_pkey', 'verification_tokens', ['token'])
+    op.create_unique_constraint('unique_verification_tokens_token', 'verification_tokens', ['token'])
@@ -5,10 +5,6 @@ Handles HTTP requests for authentication operations
 from fastapi import APIRouter, HTTPException, status
 
 from services.auth.src.core.dependencies import DBSession
-from services.auth.src.domain.user import (
-    DomainError, ValidationError, InvalidEmail, WeakPassword,
-    UserExists, InvalidCredentials, UserNotFound, VerificationFailed
-)
 from services.auth.src.schemas import (
     UserRegister, UserLogin, VerifyEmail, RefreshTokenRequest,
     RegisterResponse, LoginResponse, VerifyEmailResponse, TokenResponse, UserOut
@@ -20,8 +16,12 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 def user_orm_to_schema(user_orm) -> UserOut:
-    """Convert UserORM to UserOut schema"""
-    return UserOut(
+    """
+    Convert UserORM to UserOut schema
+
+    Rows come straight from the database, so field validation is skipped.
+    """
+    return UserOut.model_construct(
         id=user_orm.id,
         email=user_orm.email,
         role=user_orm.role,
@@ -38,7 +38,7 @@ def user_orm_to_schema(user_orm) -> UserOut:
     summary="Register new user",
     description="Create new user account and send verification email",
 )
-def register(
+async def register(
     data: UserRegister,
     db: DBSession,
 ):
@@ -55,30 +55,20 @@ def register(
     - Verification email sent (check inbox and spam folder)
 
     **Errors:**
-    - 400: Invalid email or weak password
+    - 422: Invalid email or weak password
     - 409: User with this email already exists
     """
-    try:
-        service = AuthService(db)
-        user_orm, message = service.register(
-            email=data.email.lower(),
-            password=data.password,
-            role=data.role,
-        )
-
-        return RegisterResponse(
-            user=user_orm_to_schema(user_orm),
-            message=message,
-        )
-
-    except UserExists as e:
-        raise HTTPException(status_code=409, detail=str(e))
-    except (InvalidEmail, WeakPassword, ValidationError) as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except DomainError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Registration failed: {str(e)}")
+    service = AuthService(db)
+    user_orm, message = await service.register(
+        email=data.email,
+        password=data.password,
+        role=data.role,
+    )
+
+    return RegisterResponse(
+        user=user_orm_to_schema(user_orm),
+        message=message,
+    )
 
 
 @router.post(
@@ -88,7 +78,7 @@ def register(
     summary="Login user",
     description="Authenticate user and return tokens",
 )
-def login(
+async def login(
     data: UserLogin,
     db: DBSession,
 ):
@@ -107,29 +97,21 @@ def login(
     **Errors:**
     - 401: Invalid credentials
     """
-    try:
-        service = AuthService(db)
-        user_orm, access_token, refresh_token = service.login(
-            email=data.email.lower(),
-            password=data.password,
-        )
-
-        return LoginResponse(
-            user=user_orm_to_schema(user_orm),
-            tokens=TokenResponse(
-                access_token=access_token,
-                refresh_token=refresh_token,
-                token_type="bearer",
-                expires_in=15 * 60,  # 15 minutes in seconds
-            ),
-        )
-
-    except InvalidCredentials as e:
-        raise HTTPException(status_code=401, detail=str(e))
-    except DomainError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Login failed: {str(e)}")
+    service = AuthService(db)
+    user_orm, access_token, refresh_token = await service.login(
+        email=data.email,
+        password=data.password,
+    )
+
+    return LoginResponse(
+        user=user_orm_to_schema(user_orm),
+        tokens=TokenResponse(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            token_type="bearer",
+            expires_in=15 * 60,  # 15 minutes in seconds
+        ),
+    )
 
 
 @router.post(
@@ -139,7 +121,7 @@ def login(
     summary="Verify email address",
     description="Confirm email with verification token sent to inbox",
 )
-def verify_email(
+async def verify_email(
     data: VerifyEmail,
     db: DBSession,
 ):
@@ -156,23 +138,13 @@ def verify_email(
     **Errors:**
     - 400: Invalid or expired token
     """
-    try:
-        service = AuthService(db)
-        user_orm = service.verify_email(data.token)
+    service = AuthService(db)
+    user_orm = await service.verify_email(data.token)
 
-        return VerifyEmailResponse(
-            message="Email verified successfully",
-            user=user_orm_to_schema(user_orm),
-        )
-
-    except VerificationFailed as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except UserNotFound as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except DomainError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Verification failed: {str(e)}")
+    return VerifyEmailResponse(
+        message="Email verified successfully",
+        user=user_orm_to_schema(user_orm),
+    )
 
 
 @router.post(
@@ -182,7 +154,7 @@ def verify_email(
     summary="Refresh access token",
     description="Get new access token using refresh token",
 )
-def refresh_token(
+async def refresh_token(
     data: RefreshTokenRequest,
     db: DBSession,
 ):
@@ -201,27 +173,17 @@ def refresh_token(
     **Errors:**
     - 401: Invalid or expired refresh token
     """
-    try:
-        service = AuthService(db)
-        new_access_token, new_refresh_token = service.refresh_access_token(
-            data.refresh_token
-        )
-
-        return TokenResponse(
-            access_token=new_access_token,
-            refresh_token=new_refresh_token,
-            token_type="bearer",
-            expires_in=15 * 60,  # 15 minutes in seconds
-        )
+    service = AuthService(db)
+    new_access_token, new_refresh_token = await service.refresh_access_token(
+        data.refresh_token
+    )
 
-    except InvalidCredentials as e:
-        raise HTTPException(status_code=401, detail=str(e))
-    except UserNotFound as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except DomainError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Token refresh failed: {str(e)}")
+    return TokenResponse(
+        access_token=new_access_token,
+        refresh_token=new_refresh_token,
+        token_type="bearer",
+        expires_in=15 * 60,  # 15 minutes in seconds
+    )
 
 
 @router.get(
@@ -231,7 +193,7 @@ def refresh_token(
     summary="Get current user",
     description="Get authenticated user's profile",
 )
-def get_current_user_profile(
+async def get_current_user_profile(
     db: DBSession,
 ):
     """
@@ -1,40 +1,60 @@
 """
 Database Connection and Session Management
 """
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from functools import lru_cache
+
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
 from services.auth.src.core.settings import settings
 
-_engine = None
-_session_local = None
-
-def get_engine():
-    """Lazily create and return the database engine"""
-    global _engine
-    if _engine is None:
-        _engine = create_engine(
-            settings.database_url,
-            echo=settings.env == "dev",
-            future=True,
-            pool_pre_ping=True,
-        )
-    return _engine
-
-def get_session_local():
-    """Lazily create and return the SessionLocal factory"""
-    global _session_local
-    if _session_local is None:
-        engine = get_engine()
-        _session_local = sessionmaker(
-            bind=engine,
-            autocommit=False,
-            autoflush=False,
-            expire_on_commit=False,
-        )
-    return _session_local
-
-# For backwards compatibility - these will call the functions
-# engine is kept as a callable for compatibility
-engine = None  # Will be created lazily
-SessionLocal = None  # Will be created lazily
+
+def _async_database_url(url: str) -> str:
+    """Route plain postgresql:// URLs through the asyncpg driver"""
+    return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """Lazily create and return the async database engine (app-wide singleton)"""
+    return create_async_engine(
+        _async_database_url(settings.database_url),
+        echo=settings.env == "dev",
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_pool_overflow,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=True,
+        pool_use_lifo=settings.db_pool_use_lifo,
+        query_cache_size=1200,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_session_local() -> async_sessionmaker:
+    """Lazily create and return the AsyncSession factory (app-wide singleton)"""
+    return async_sessionmaker(
+        bind=get_engine(),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+async def dispose_engine() -> None:
+    """Close all pooled connections (called on application shutdown)"""
+    if get_engine.cache_info().currsize:
+        await get_engine().dispose()
+    get_session_local.cache_clear()
+    get_engine.cache_clear()
+
+
+def __getattr__(name: str):
+    """
+    Resolve `engine` / `SessionLocal` on first access (PEP 562).
+
+    Keeps `from ...core.db import SessionLocal` working without building
+    the engine at import time.
+    """
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_local()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
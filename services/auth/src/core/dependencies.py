@@ -4,48 +4,52 @@ Database session and current user extraction
 """
 from __future__ import annotations
 
-from typing import Annotated, Generator, Optional
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Annotated, AsyncGenerator, Optional
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, Header
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.auth.src.core.db import get_session_local
-from services.auth.src.core.jwt_utils import verify_access_token
+from services.auth.src.core.jwt_utils import decode_user_id, verify_access_token
 
 
 # ========== Database Session ==========
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Provide database session with automatic cleanup"""
     session_local = get_session_local()
-    db = session_local()
-    try:
+    async with session_local() as db:
         yield db
-    finally:
-        db.close()
 
 
-DBSession = Annotated[Session, Depends(get_db)]
+DBSession = Annotated[AsyncSession, Depends(get_db)]
 
 
 # ========== Authentication ==========
 
-class CurrentUser:
-    """Represents the authenticated user"""
-    def __init__(self, user_id: UUID, email: str, role: str):
-        self.user_id = user_id
-        self.email = email
-        self.role = role
+class Role(IntEnum):
+    """User role, decoded once from the token claim"""
+    USER = 0
+    PARTNER = 1
+    ADMIN = 2
 
-    def is_admin(self) -> bool:
-        return self.role == "admin"
 
-    def is_partner(self) -> bool:
-        return self.role == "partner"
+_ROLES_BY_CLAIM = {
+    "user": Role.USER,
+    "partner": Role.PARTNER,
+    "admin": Role.ADMIN,
+}
 
-    def is_user(self) -> bool:
-        return self.role == "user"
+
+@dataclass(slots=True, frozen=True)
+class CurrentUser:
+    """Represents the authenticated user"""
+    user_id: UUID
+    email: str
+    role: Role
 
 
 def get_current_user(
@@ -60,11 +64,8 @@ def get_current_user(
         raise HTTPException(status_code=401, detail="Missing authorization header")
 
     # Expected format: "Bearer <token>"
-    try:
-        scheme, token = authorization.split()
-        if scheme.lower() != "bearer":
-            raise ValueError("Invalid auth scheme")
-    except ValueError:
+    scheme, sep, token = authorization.partition(" ")
+    if not sep or scheme.lower() != "bearer" or not token:
         raise HTTPException(status_code=401, detail="Invalid authorization header format")
 
     # Verify token
@@ -73,9 +74,9 @@ def get_current_user(
         raise HTTPException(status_code=401, detail="Invalid or expired token")
 
     try:
-        user_id = UUID(payload["user_id"])
+        user_id = decode_user_id(payload["uid"])
         email = payload["email"]
-        role = payload["role"]
+        role = _ROLES_BY_CLAIM[payload["role"]]
         return CurrentUser(user_id=user_id, email=email, role=role)
     except (KeyError, ValueError) as e:
         raise HTTPException(status_code=401, detail=f"Invalid token claims: {e}")
@@ -83,21 +84,21 @@ def get_current_user(
 
 def require_admin(user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
     """Require admin role"""
-    if not user.is_admin():
+    if user.role is not Role.ADMIN:
         raise HTTPException(status_code=403, detail="Admin role required")
     return user
 
 
 def require_partner(user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
     """Require partner role"""
-    if not user.is_partner():
+    if user.role is not Role.PARTNER:
         raise HTTPException(status_code=403, detail="Partner role required")
     return user
 
 
 def require_user(user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
     """Require user role"""
-    if not user.is_user():
+    if user.role is not Role.USER:
         raise HTTPException(status_code=403, detail="User role required")
     return user
 
@@ -0,0 +1,97 @@
+"""
+Background Email Delivery
+Verification emails are queued by the request path and sent by worker tasks,
+so registration latency and success do not depend on the SMTP server.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+from uuid import UUID
+
+from services.auth.src.core.email_service import EmailService, get_email_service
+
+logger = logging.getLogger("auth.email")
+
+
+@dataclass(frozen=True, slots=True)
+class EmailJob:
+    """A verification email waiting to be sent"""
+    email: str
+    verification_token: str
+    user_id: UUID
+
+
+class EmailQueue:
+    """In-process queue drained by background worker tasks"""
+
+    def __init__(self, email_service: EmailService, workers: int = 1, batch_size: int = 32):
+        self.email_service = email_service
+        self.workers = workers
+        self.batch_size = batch_size
+        self._queue: Optional[asyncio.Queue[EmailJob]] = None
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Spawn worker tasks on the running event loop (application startup)"""
+        self._queue = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"email-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Give pending emails a chance to go out, then stop the workers"""
+        if self._queue is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Dropping %d unsent verification emails", self._queue.qsize())
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def enqueue(self, job: EmailJob) -> None:
+        """Queue an email for delivery without waiting on SMTP"""
+        if self._queue is None:
+            raise RuntimeError("Email queue is not running")
+        self._queue.put_nowait(job)
+
+    async def _worker(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            # Under burst, drain what is already waiting and ship it together
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await asyncio.to_thread(self._send_batch, batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _send_batch(self, batch: list[EmailJob]) -> None:
+        for job in batch:
+            try:
+                sent = self.email_service.send_verification_email(
+                    email=job.email,
+                    verification_token=job.verification_token,
+                    user_id=job.user_id,
+                )
+            except Exception:
+                logger.exception("Verification email to %s failed", job.email)
+                continue
+            if not sent:
+                logger.warning("Verification email to %s was not sent", job.email)
+
+
+@lru_cache(maxsize=1)
+def get_email_queue() -> EmailQueue:
+    """App-wide email queue backed by the configured email service"""
+    return EmailQueue(get_email_service())
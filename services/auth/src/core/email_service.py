@@ -3,13 +3,32 @@ Email Service for Sending Verification Emails
 Can be extended to use SendGrid, Mailgun, etc.
 """
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Optional
 from uuid import UUID
+import io
 import smtplib
+import threading
+from email.generator import BytesGenerator
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
 from services.auth.src.core.settings import settings
 
+_VERIFICATION_SUBJECT = "Verify your EST account"
+
+_HTML_TEMPLATE = """
+            <html>
+                <body>
+                    <h1>Welcome to EST!</h1>
+                    <p>Please verify your email address by clicking the link below:</p>
+                    <a href="{url}">Verify Email</a>
+                    <p>Or copy this link: {url}</p>
+                    <p>This link expires in 24 hours.</p>
+                </body>
+            </html>
+            """
+
 
 class EmailService(ABC):
     """Abstract base for email services"""
@@ -19,6 +38,10 @@ class EmailService(ABC):
         """Send verification email. Returns True if successful."""
         pass
 
+    def close(self) -> None:
+        """Release any held connections (called on application shutdown)"""
+        pass
+
 
 class MockEmailService(EmailService):
     """Development email service that logs instead of sending"""
@@ -36,42 +59,71 @@ class MockEmailService(EmailService):
 
 
 class SMTPEmailService(EmailService):
-    """SMTP email service for production"""
+    """
+    SMTP email service for production.
+
+    Keeps a single SMTP session open across sends so each email costs one
+    message exchange instead of a fresh TCP + STARTTLS + AUTH handshake.
+    """
+
+    def __init__(self):
+        self._conn: Optional[smtplib.SMTP] = None
+        self._lock = threading.Lock()
+        self._buffer = io.BytesIO()
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(settings.smtp_server, settings.smtp_port)
+        if settings.smtp_user:
+            server.starttls()
+            server.login(settings.smtp_user, settings.smtp_password)
+        return server
+
+    def _serialize(self, msg: MIMEMultipart) -> bytes:
+        """Flatten the message once into the reused buffer (caller holds the lock)"""
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        BytesGenerator(self._buffer, policy=msg.policy.clone(linesep="\r\n")).flatten(msg)
+        return self._buffer.getvalue()
+
+    def _send(self, msg: MIMEMultipart) -> None:
+        with self._lock:
+            data = self._serialize(msg)
+            if self._conn is None:
+                self._conn = self._connect()
+            try:
+                self._conn.sendmail(msg["From"], [msg["To"]], data)
+            except smtplib.SMTPServerDisconnected:
+                # Server dropped the idle session - reconnect once and retry
+                self._conn = self._connect()
+                self._conn.sendmail(msg["From"], [msg["To"]], data)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.quit()
+                except smtplib.SMTPException:
+                    pass
+                self._conn = None
 
     def send_verification_email(self, email: str, verification_token: str, user_id: UUID) -> bool:
         """Send verification email via SMTP"""
         try:
             verification_url = f"{settings.auth_service_url}/auth/verify-email?token={verification_token}"
 
-            subject = "Verify your EST account"
-            html_body = f"""
-            <html>
-                <body>
-                    <h1>Welcome to EST!</h1>
-                    <p>Please verify your email address by clicking the link below:</p>
-                    <a href="{verification_url}">Verify Email</a>
-                    <p>Or copy this link: {verification_url}</p>
-                    <p>This link expires in 24 hours.</p>
-                </body>
-            </html>
-            """
+            html_body = _HTML_TEMPLATE.format_map({"url": verification_url})
 
             # Create message
             msg = MIMEMultipart("alternative")
-            msg["Subject"] = subject
+            msg["Subject"] = _VERIFICATION_SUBJECT
             msg["From"] = settings.smtp_from_email
             msg["To"] = email
 
             part = MIMEText(html_body, "html")
             msg.attach(part)
 
-            # Send
-            with smtplib.SMTP(settings.smtp_host, settings.smtp_port) as server:
-                if settings.smtp_user:
-                    server.starttls()
-                    server.login(settings.smtp_user, settings.smtp_password)
-
-                server.sendmail(settings.smtp_from_email, [email], msg.as_string())
+            # Send over the shared connection
+            self._send(msg)
 
             return True
         except Exception as e:
@@ -79,8 +131,9 @@ class SMTPEmailService(EmailService):
             return False
 
 
+@lru_cache(maxsize=1)
 def get_email_service() -> EmailService:
-    """Factory to get appropriate email service based on environment"""
+    """Factory to get appropriate email service based on environment (app-wide singleton)"""
     if settings.env == "dev":
         return MockEmailService()
     else:
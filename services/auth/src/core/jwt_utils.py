@@ -2,21 +2,83 @@
 JWT Token Management Utilities
 Handles encoding and decoding JWT tokens with user claims
 """
+import base64
+import hashlib
+import hmac
+import ssl
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 
 import jwt
+import orjson
 
 from services.auth.src.core.settings import settings
 
+# Verified payloads keyed by a BLAKE2b digest of the token (a cache key only,
+# not a security boundary), so repeat requests with the same token skip
+# signature verification until the token expires.
+_DECODE_CACHE_SIZE = 8192
+_decode_cache: OrderedDict[bytes, dict] = OrderedDict()
+_decode_cache_lock = threading.Lock()
+
+
+# ========== HS256 fast path ==========
+# HS256 (the default algorithm) is signed and verified directly with hmac +
+# orjson; PyJWT is only used when another algorithm is configured.
+# hmac.digest() with a digest *name* runs the whole HMAC inside OpenSSL,
+# which dispatches to the CPU's SHA extensions (SHA-NI / ARMv8) when present.
+
+try:
+    import _hashlib
+    _OPENSSL_SHA256 = hashlib.sha256 is _hashlib.openssl_sha256
+except ImportError:
+    _OPENSSL_SHA256 = False
+
+SHA256_BACKEND = (
+    f"sha256/{ssl.OPENSSL_VERSION}" if _OPENSSL_SHA256 else "sha256/builtin (no OpenSSL)"
+)
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+_HS256_HEADER = _b64encode(orjson.dumps({"alg": "HS256", "typ": "JWT"}))
+_SECRET = settings.jwt_secret.encode()
+
+
+def _encode(payload: dict) -> str:
+    if settings.jwt_algorithm != "HS256":
+        return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+
+    signing_input = _HS256_HEADER + b"." + _b64encode(orjson.dumps(payload))
+    signature = hmac.digest(_SECRET, signing_input, "sha256")
+    return (signing_input + b"." + _b64encode(signature)).decode()
+
+
+def encode_user_id(user_id: UUID) -> str:
+    """Pack a user id into the compact "uid" claim (base64url of the 16 raw bytes)"""
+    return _b64encode(user_id.bytes).decode()
+
+
+def decode_user_id(uid: str) -> UUID:
+    """Unpack the "uid" claim; UUID(bytes=...) skips string parsing"""
+    return UUID(bytes=_b64decode(uid.encode()))
+
 
 def create_access_token(user_id: UUID, email: str, role: str) -> str:
     """
     Create a short-lived access token (15 minutes by default)
 
     Claims:
-    - user_id: User's UUID
+    - uid: User's UUID (base64url-encoded bytes)
     - email: User's email
     - role: User's role (user, partner, admin)
     - type: "access" (for distinguishing from refresh tokens)
@@ -27,21 +89,15 @@ def create_access_token(user_id: UUID, email: str, role: str) -> str:
     expire = now + timedelta(minutes=settings.jwt_access_token_expire_minutes)
 
     payload = {
-        "user_id": str(user_id),
+        "uid": encode_user_id(user_id),
         "email": email,
         "role": role,
         "type": "access",
-        "iat": now,
-        "exp": expire,
+        "iat": int(now.timestamp()),
+        "exp": int(expire.timestamp()),
     }
 
-    token = jwt.encode(
-        payload,
-        settings.jwt_secret,
-        algorithm=settings.jwt_algorithm,
-    )
-
-    return token
+    return _encode(payload)
 
 
 def create_refresh_token(user_id: UUID, email: str) -> str:
@@ -49,7 +105,7 @@ def create_refresh_token(user_id: UUID, email: str) -> str:
     Create a long-lived refresh token (7 days by default)
 
     Claims:
-    - user_id: User's UUID
+    - uid: User's UUID (base64url-encoded bytes)
     - email: User's email
     - type: "refresh"
     - iat: Issued at
@@ -59,39 +115,85 @@ def create_refresh_token(user_id: UUID, email: str) -> str:
     expire = now + timedelta(days=settings.jwt_refresh_token_expire_days)
 
     payload = {
-        "user_id": str(user_id),
+        "uid": encode_user_id(user_id),
         "email": email,
         "type": "refresh",
-        "iat": now,
-        "exp": expire,
+        "iat": int(now.timestamp()),
+        "exp": int(expire.timestamp()),
     }
 
-    token = jwt.encode(
-        payload,
-        settings.jwt_secret,
-        algorithm=settings.jwt_algorithm,
-    )
-
-    return token
+    return _encode(payload)
 
 
 def decode_token(token: str) -> Optional[dict]:
     """
     Decode and validate a JWT token
-    Returns decoded payload or None if invalid/expired
+    Returns decoded payload (a fresh dict per call) or None if invalid/expired
     """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    with _decode_cache_lock:
+        payload = _decode_cache.get(key)
+        if payload is not None:
+            _decode_cache.move_to_end(key)
+
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is None or exp > time.time():
+            return dict(payload)
+        # Expired since it was cached
+        with _decode_cache_lock:
+            _decode_cache.pop(key, None)
+        return None
+
+    payload = _decode_uncached(token)
+    if payload is not None:
+        with _decode_cache_lock:
+            _decode_cache[key] = payload
+            if len(_decode_cache) > _DECODE_CACHE_SIZE:
+                _decode_cache.popitem(last=False)
+        return dict(payload)
+    return None
+
+
+def _decode_uncached(token: str) -> Optional[dict]:
+    """Verify signature and claims of a JWT token"""
+    if settings.jwt_algorithm != "HS256":
+        try:
+            return jwt.decode(
+                token,
+                settings.jwt_secret,
+                algorithms=[settings.jwt_algorithm],
+            )
+        except jwt.ExpiredSignatureError:
+            return None  # Token expired
+        except jwt.InvalidTokenError:
+            return None  # Invalid token
+
+    if token.count(".") != 2:
+        return None  # Malformed token
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret,
-            algorithms=[settings.jwt_algorithm],
-        )
-        return payload
-    except jwt.ExpiredSignatureError:
-        return None  # Token expired
-    except jwt.InvalidTokenError:
+        raw = token.encode()
+        signing_input, _, signature = raw.rpartition(b".")
+        expected = hmac.digest(_SECRET, signing_input, "sha256")
+        if not hmac.compare_digest(_b64decode(signature), expected):
+            return None  # Bad signature
+
+        header_b64, _, payload_b64 = signing_input.partition(b".")
+        if orjson.loads(_b64decode(header_b64)).get("alg") != "HS256":
+            return None  # Unexpected algorithm
+        payload = orjson.loads(_b64decode(payload_b64))
+    except (ValueError, AttributeError):
         return None  # Invalid token
 
+    if not isinstance(payload, dict):
+        return None
+    exp = payload.get("exp")
+    if exp is not None:
+        if not isinstance(exp, (int, float)) or exp <= time.time():
+            return None  # Token expired
+    return payload
+
 
 def verify_access_token(token: str) -> Optional[dict]:
     """Verify token is valid access token and return claims"""
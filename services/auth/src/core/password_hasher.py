@@ -0,0 +1,61 @@
+"""
+Password Hashing Pool
+bcrypt is ~100-300 ms of pure CPU per call, so hashing and verification run
+on a process pool: the event loop stays responsive and concurrent logins
+scale with CPU cores instead of queueing on the GIL.
+"""
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional
+
+from anyio import to_thread
+
+from services.auth.src.core.settings import settings
+from services.auth.src.domain.user import Password
+
+
+class PasswordHasher:
+    """Runs bcrypt work on a persistent process pool"""
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def start(self) -> None:
+        """Create the worker pool (application startup)"""
+        # spawn, not fork: forking a process that already runs an event loop
+        # and worker threads can copy held locks into the child
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def stop(self) -> None:
+        """Shut down the worker pool (application shutdown)"""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    async def hash(self, password: Password) -> str:
+        """Hash an already validated password"""
+        return await self._run(password.hash, settings.bcrypt_rounds)
+
+    async def verify(self, password_plain: str, password_hash: str) -> bool:
+        """Verify plain password against hash"""
+        return await self._run(Password.verify, password_plain, password_hash)
+
+    async def _run(self, fn, *args):
+        if self._pool is None:
+            # Pool not started (scripts, ad-hoc use): still keep bcrypt off
+            # the loop, on the same bounded threadpool FastAPI uses
+            return await to_thread.run_sync(fn, *args)
+        return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+
+
+@lru_cache(maxsize=1)
+def get_password_hasher() -> PasswordHasher:
+    """App-wide password hasher"""
+    return PasswordHasher()
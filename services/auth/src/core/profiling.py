@@ -0,0 +1,52 @@
+"""
+Request Profiling (dev only)
+Samples the call stack of each request with pyinstrument and writes an HTML
+report for requests slower than a threshold, to show whether time goes to
+bcrypt, the database, or serialization.
+"""
+import logging
+import time
+from pathlib import Path
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+try:
+    from pyinstrument import Profiler
+except ImportError:  # optional dev dependency
+    Profiler = None
+
+logger = logging.getLogger("auth.profiling")
+
+
+class PyInstrumentMiddleware(BaseHTTPMiddleware):
+    """Profile each request; keep reports for the slow ones"""
+
+    def __init__(self, app, output_dir: str, threshold_ms: float):
+        super().__init__(app)
+        self.output_dir = Path(output_dir)
+        self.threshold_ms = threshold_ms
+
+    async def dispatch(self, request: Request, call_next):
+        profiler = Profiler(interval=0.001, async_mode="enabled")
+        start = time.perf_counter()
+        profiler.start()
+        try:
+            return await call_next(request)
+        finally:
+            profiler.stop()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if elapsed_ms >= self.threshold_ms:
+                self._write_report(request, profiler, elapsed_ms)
+
+    def _write_report(self, request: Request, profiler, elapsed_ms: float) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        name = request.url.path.strip("/").replace("/", "_") or "root"
+        path = self.output_dir / f"{request.method}_{name}_{int(time.time() * 1000)}.html"
+        path.write_text(profiler.output_html())
+        logger.info("Profiled %s %s (%.1f ms) -> %s", request.method, request.url.path, elapsed_ms, path)
+
+
+def profiling_available() -> bool:
+    """True if pyinstrument is installed"""
+    return Profiler is not None
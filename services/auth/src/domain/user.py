@@ -6,13 +6,26 @@ This layer has zero dependencies on infrastructure (database, HTTP, etc).
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+import hashlib
 from uuid import UUID, uuid4
 import re
+import secrets
 from typing import Optional
 
 import bcrypt
 
+# Upper bound on password length, checked before any other work so that
+# attacker-sized payloads can't inflate validation cost
+PASSWORD_MAX_LENGTH = 256
+
+# bcrypt only uses the first 72 bytes of its input; bcrypt>=5 raises on longer
+# input instead of truncating, so truncate explicitly (as 4.x did internally)
+_BCRYPT_MAX_BYTES = 72
+
+# Simple email validation (RFC 5322 simplified)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 
 # ========== Domain Exceptions ==========
 
@@ -69,10 +82,10 @@ class Email:
     value: str
 
     def __post_init__(self):
-        # Simple email validation (RFC 5322 simplified)
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, self.value):
+        if not _EMAIL_RE.match(self.value):
             raise InvalidEmail(f"Invalid email format: {self.value}")
+        # Emails are stored and compared lowercased
+        object.__setattr__(self, 'value', self.value.lower())
 
     @property
     def email(self) -> str:
@@ -89,30 +102,51 @@ class Password:
 
     def __post_init__(self):
         # Password requirements:
-        # - At least 8 characters
+        # - At least 8 characters (at most PASSWORD_MAX_LENGTH)
         # - At least one uppercase letter
         # - At least one lowercase letter
         # - At least one digit
+        if len(self.value) > PASSWORD_MAX_LENGTH:
+            raise WeakPassword(f"Password must be at most {PASSWORD_MAX_LENGTH} characters")
+
         if len(self.value) < 8:
             raise WeakPassword("Password must be at least 8 characters")
 
-        if not any(c.isupper() for c in self.value):
+        # Classify characters in a single pass. Keep this plain Python: it is
+        # negligible next to the bcrypt hash that follows, and a JIT/native
+        # extension (Numba, Cython) would cost more in import/warm-up than it saves
+        has_upper = has_lower = has_digit = False
+        for c in self.value:
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+            elif c.isdigit():
+                has_digit = True
+            else:
+                continue
+            if has_upper and has_lower and has_digit:
+                break
+
+        if not has_upper:
             raise WeakPassword("Password must contain at least one uppercase letter")
 
-        if not any(c.islower() for c in self.value):
+        if not has_lower:
             raise WeakPassword("Password must contain at least one lowercase letter")
 
-        if not any(c.isdigit() for c in self.value):
+        if not has_digit:
             raise WeakPassword("Password must contain at least one digit")
 
-    def hash(self) -> str:
-        """Hash password using bcrypt"""
-        return bcrypt.hashpw(self.value.encode(), bcrypt.gensalt()).decode()
+    def hash(self, rounds: int = 12) -> str:
+        """Hash password using bcrypt with the given cost factor"""
+        secret = self.value.encode()[:_BCRYPT_MAX_BYTES]
+        return bcrypt.hashpw(secret, bcrypt.gensalt(rounds)).decode()
 
     @staticmethod
     def verify(password_plain: str, password_hash: str) -> bool:
         """Verify plain password against hash"""
-        return bcrypt.checkpw(password_plain.encode(), password_hash.encode())
+        secret = password_plain.encode()[:_BCRYPT_MAX_BYTES]
+        return bcrypt.checkpw(secret, password_hash.encode())
 
 
 # ========== Domain Aggregates ==========
@@ -137,8 +171,14 @@ class User:
         email: str,
         password: str,
         role: str = "user",
+        password_hash: Optional[str] = None,
     ) -> User:
-        """Factory method to create new user with validation"""
+        """
+        Factory method to create new user with validation
+
+        `password_hash` may carry a hash of `password` computed elsewhere
+        (e.g. on the hashing pool); otherwise the password is hashed inline.
+        """
         # Validate email
         email_obj = Email(email)  # Raises InvalidEmail if invalid
 
@@ -155,7 +195,7 @@ class User:
         return User(
             id=uuid4(),
             email=email_obj,
-            password_hash=password_obj.hash(),
+            password_hash=password_hash or password_obj.hash(),
             role=role,
             is_verified=False,
             created_at=now,
@@ -182,6 +222,7 @@ class VerificationToken:
     """
     Email verification token.
     Represents a single-use token sent to user's email.
+    Only the SHA-256 digest of the token is persisted.
     """
     token: str
     user_id: UUID
@@ -191,13 +232,8 @@ class VerificationToken:
     @staticmethod
     def create(user_id: UUID, validity_hours: int = 24) -> VerificationToken:
         """Create new verification token"""
-        import secrets
         token = secrets.token_urlsafe(32)
-        now = datetime.now(timezone.utc)
-        expires_at = datetime.fromtimestamp(
-            now.timestamp() + (validity_hours * 3600),
-            tz=timezone.utc
-        )
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=validity_hours)
 
         return VerificationToken(
             token=token,
@@ -206,6 +242,16 @@ class VerificationToken:
             used=False,
         )
 
+    @property
+    def token_hash(self) -> bytes:
+        """Digest stored in the database in place of the token"""
+        return VerificationToken.hash_token(self.token)
+
+    @staticmethod
+    def hash_token(token: str) -> bytes:
+        """SHA-256 digest of a token string"""
+        return hashlib.sha256(token.encode()).digest()
+
     def is_valid(self, current_time: Optional[datetime] = None) -> bool:
         """Check if token is still valid (not expired and not used)"""
         if self.used:
@@ -3,26 +3,76 @@ EST Auth Service - Main FastAPI Application
 """
 import logging
 import time
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 from sqlalchemy import text
 
-from services.auth.src.core.db import get_engine
+from services.auth.src.core.db import dispose_engine, get_engine
+from services.auth.src.core.email_queue import get_email_queue
+from services.auth.src.core.email_service import get_email_service
+from services.auth.src.core.jwt_utils import SHA256_BACKEND
+from services.auth.src.core.password_hasher import get_password_hasher
+from services.auth.src.core.profiling import PyInstrumentMiddleware, profiling_available
 from services.auth.src.core.settings import settings
+from services.auth.src.domain.user import (
+    DomainError, InvalidCredentials, InvalidToken, UserExists, UserNotFound
+)
 from services.auth.src.api import router as auth_router
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks"""
+    logger.info("JWT signing backend: %s", SHA256_BACKEND)
+    password_hasher = get_password_hasher()
+    password_hasher.start()
+    email_queue = get_email_queue()
+    email_queue.start()
+    yield
+    await email_queue.stop()
+    password_hasher.stop()
+    get_email_service().close()
+    await dispose_engine()
+
+
 app = FastAPI(
     title=settings.app_name,
     description="Authentication service for EST - Food at Lower Prices",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 logger = logging.getLogger("auth.request")
 
+# Token/user payloads are JWT-heavy JSON; compress anything non-trivial
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # Include routers
 app.include_router(auth_router)
 
 
+# HTTP status per domain error; anything not listed (validation errors,
+# VerificationFailed, ...) is a 400
+DOMAIN_ERROR_STATUS = {
+    UserExists: 409,
+    InvalidCredentials: 401,
+    InvalidToken: 401,
+    UserNotFound: 404,
+}
+
+
+@app.exception_handler(DomainError)
+async def domain_error_handler(request: Request, exc: DomainError):
+    """Translate domain errors raised by the service layer into HTTP responses"""
+    return JSONResponse(
+        status_code=DOMAIN_ERROR_STATUS.get(type(exc), 400),
+        content={"detail": str(exc)},
+    )
+
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     start = time.perf_counter()
@@ -38,6 +88,18 @@ async def log_requests(request: Request, call_next):
     return response
 
 
+# Added after log_requests so the profile covers the whole request
+if settings.env == "dev" and settings.profiling_enabled:
+    if profiling_available():
+        app.add_middleware(
+            PyInstrumentMiddleware,
+            output_dir=settings.profiling_output_dir,
+            threshold_ms=settings.profiling_threshold_ms,
+        )
+    else:
+        logger.warning("PROFILING_ENABLED is set but pyinstrument is not installed")
+
+
 @app.get("/health")
 def health():
     """Service health check"""
@@ -49,12 +111,12 @@ def health():
 
 
 @app.get("/db/health")
-def db_health():
+async def db_health():
     """Database connection health check"""
     try:
         engine = get_engine()
-        with engine.connect() as conn:
-            conn.execute(text("select 1"))
+        async with engine.connect() as conn:
+            await conn.execute(text("select 1"))
         return {"db": "ok"}
     except Exception as e:
         return {"db": "error", "detail": str(e)}
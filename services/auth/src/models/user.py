@@ -7,7 +7,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import String, DateTime, Boolean, Index
+from sqlalchemy import String, DateTime, Boolean, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -20,18 +20,17 @@ class UserORM(Base):
 
     id: Mapped[str] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
 
-    email: Mapped[str] = mapped_column(String(254), nullable=False, unique=True, index=True)
+    email: Mapped[str] = mapped_column(String(254), nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
 
     role: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
         default="user",
-        index=True,
         comment="user, partner, or admin"
     )
 
-    is_verified: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, index=True)
+    is_verified: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -45,9 +44,9 @@ class UserORM(Base):
         onupdate=datetime.utcnow
     )
 
-    # Indexes for common queries
+    # Indexes for common queries (email lookups use the unique constraint's index)
     __table_args__ = (
-        Index("idx_users_email", "email"),
+        UniqueConstraint("email", name="unique_users_email"),
         Index("idx_users_role", "role"),
         Index("idx_users_is_verified", "is_verified"),
     )
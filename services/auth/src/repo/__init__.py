@@ -4,68 +4,89 @@ User Repository - Database access layer for users
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, lambda_stmt, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.auth.src.models.user import UserORM
-from services.auth.src.domain.user import User, Email, InvalidEmail
+from services.auth.src.domain.user import User, Email, InvalidEmail, UserExists
 
 
 class UserRepository:
     """Repository for User aggregate"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def save(self, user: User) -> UserORM:
-        """Save user to database"""
-        orm = UserORM(
-            id=user.id,
-            email=user.email.value,
-            password_hash=user.password_hash,
-            role=user.role,
-            is_verified=user.is_verified,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
+    async def save(self, user: User) -> UserORM:
+        """
+        Insert a new user.
+
+        Uniqueness is checked by the INSERT itself (ON CONFLICT on email), so
+        there is no separate existence query and no race between the two.
+
+        Raises:
+            UserExists: If a user with this email already exists
+        """
+        stmt = (
+            insert(UserORM)
+            .values(
+                id=user.id,
+                email=user.email.value,
+                password_hash=user.password_hash,
+                role=user.role,
+                is_verified=user.is_verified,
+                created_at=user.created_at,
+                updated_at=user.updated_at,
+            )
+            .on_conflict_do_nothing(index_elements=[UserORM.email])
+            .returning(UserORM)
         )
-        self.db.add(orm)
-        self.db.commit()
-        self.db.refresh(orm)
+        orm = (await self.db.scalars(stmt)).first()
+        if orm is None:
+            await self.db.rollback()
+            raise UserExists(f"User with email {user.email.value} already exists")
+        await self.db.commit()
         return orm
 
-    def get_by_email(self, email: str) -> Optional[UserORM]:
-        """Get user by email"""
-        query = select(UserORM).where(UserORM.email == email.lower())
-        return self.db.scalars(query).first()
+    async def get_by_email(self, email: str) -> Optional[UserORM]:
+        """Get user by email (expects the lowercased form, see Email)"""
+        # lambda_stmt caches the compiled SQL; `email` is extracted as a bound parameter
+        query = lambda_stmt(lambda: select(UserORM).where(UserORM.email == email))
+        return (await self.db.scalars(query)).first()
 
-    def get_by_id(self, user_id: UUID) -> Optional[UserORM]:
+    async def get_by_id(self, user_id: UUID) -> Optional[UserORM]:
         """Get user by ID"""
-        return self.db.get(UserORM, user_id)
+        return await self.db.get(UserORM, user_id)
 
-    def update(self, user_id: UUID, **kwargs) -> Optional[UserORM]:
-        """Update user fields"""
-        user = self.get_by_id(user_id)
-        if not user:
-            return None
+    async def update(self, user_id: UUID, **kwargs) -> Optional[UserORM]:
+        """Update user fields with a single UPDATE ... RETURNING"""
+        values = {key: value for key, value in kwargs.items() if hasattr(UserORM, key)}
+        if not values:
+            return await self.get_by_id(user_id)
 
-        for key, value in kwargs.items():
-            if hasattr(user, key):
-                setattr(user, key, value)
-
-        self.db.commit()
-        self.db.refresh(user)
+        stmt = (
+            update(UserORM)
+            .where(UserORM.id == user_id)
+            .values(**values)
+            .returning(UserORM)
+            .execution_options(populate_existing=True)
+        )
+        user = (await self.db.scalars(stmt)).first()
+        await self.db.commit()
         return user
 
-    def delete(self, user_id: UUID) -> bool:
+    async def delete(self, user_id: UUID) -> bool:
         """Delete user"""
-        user = self.get_by_id(user_id)
+        user = await self.get_by_id(user_id)
         if not user:
             return False
 
-        self.db.delete(user)
-        self.db.commit()
+        await self.db.delete(user)
+        await self.db.commit()
         return True
 
-    def exists_by_email(self, email: str) -> bool:
-        """Check if user exists by email"""
-        return self.get_by_email(email) is not None
+    async def exists_by_email(self, email: str) -> bool:
+        """Check if user exists by email (EXISTS query, no row is loaded)"""
+        query = lambda_stmt(lambda: select(exists().where(UserORM.email == email)))
+        return bool(await self.db.scalar(query))
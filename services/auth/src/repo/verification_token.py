@@ -5,8 +5,8 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, lambda_stmt, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.auth.src.models.verification_token import VerificationTokenORM
 from services.auth.src.domain.user import VerificationToken
@@ -15,57 +15,65 @@ from services.auth.src.domain.user import VerificationToken
 class VerificationTokenRepository:
     """Repository for VerificationToken aggregate"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def save(self, token: VerificationToken) -> VerificationTokenORM:
+    async def save(self, token: VerificationToken) -> VerificationTokenORM:
         """Save verification token to database"""
         orm = VerificationTokenORM(
-            token=token.token,
+            token_hash=token.token_hash,
             user_id=token.user_id,
             expires_at=token.expires_at,
             used=token.used,
         )
         self.db.add(orm)
-        self.db.commit()
-        self.db.refresh(orm)
+        await self.db.commit()
         return orm
 
-    def get_by_token(self, token: str) -> Optional[VerificationTokenORM]:
+    async def get_by_token(self, token: str) -> Optional[VerificationTokenORM]:
         """Get verification token by token string"""
-        query = select(VerificationTokenORM).where(VerificationTokenORM.token == token)
-        return self.db.scalars(query).first()
+        token_hash = VerificationToken.hash_token(token)
+        query = lambda_stmt(
+            lambda: select(VerificationTokenORM).where(VerificationTokenORM.token_hash == token_hash)
+        )
+        return (await self.db.scalars(query)).first()
 
-    def get_by_user_id(self, user_id: UUID) -> Optional[VerificationTokenORM]:
+    async def get_by_user_id(self, user_id: UUID) -> Optional[VerificationTokenORM]:
         """Get latest verification token for user"""
         query = (
             select(VerificationTokenORM)
             .where(VerificationTokenORM.user_id == user_id)
             .order_by(VerificationTokenORM.created_at.desc())
         )
-        return self.db.scalars(query).first()
-
-    def mark_as_used(self, token_str: str) -> bool:
-        """Mark token as used"""
-        token = self.get_by_token(token_str)
-        if not token:
-            return False
+        return (await self.db.scalars(query)).first()
 
-        token.used = True
-        self.db.commit()
-        return True
+    async def mark_as_used(self, token_str: str) -> bool:
+        """
+        Mark token as used. Returns False if the token is unknown, expired or
+        already used, so only one caller can ever consume it.
+        """
+        stmt = (
+            update(VerificationTokenORM)
+            .where(
+                VerificationTokenORM.token_hash == VerificationToken.hash_token(token_str),
+                VerificationTokenORM.used.is_(False),
+                VerificationTokenORM.expires_at > datetime.now(timezone.utc),
+            )
+            .values(used=True)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        return result.rowcount > 0
 
-    def clean_expired(self) -> int:
+    async def clean_expired(self) -> int:
         """Delete expired tokens. Returns number deleted."""
         now = datetime.now(timezone.utc)
-        query = select(VerificationTokenORM).where(
-            VerificationTokenORM.expires_at < now
+        stmt = (
+            delete(VerificationTokenORM)
+            .where(VerificationTokenORM.expires_at < now)
+            .execution_options(synchronize_session=False)
         )
-        tokens = self.db.scalars(query).all()
-        count = len(tokens)
-
-        for token in tokens:
-            self.db.delete(token)
-
-        self.db.commit()
-        return count
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        return result.rowcount
@@ -6,15 +6,50 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
 
+from services.auth.src.domain.user import (
+    Email, InvalidEmail, Password, WeakPassword, PASSWORD_MAX_LENGTH
+)
+
 
 # ========== Request Schemas ==========
 
+def _normalize_email(v):
+    """Canonical email form: surrounding whitespace stripped, lowercased"""
+    return v.strip().lower() if isinstance(v, str) else v
+
+
 class UserRegister(BaseModel):
     """User registration request"""
     email: str = Field(..., description="Email address")
-    password: str = Field(..., min_length=8, description="Password (min 8 chars, must include uppercase, lowercase, digit)")
+    password: str = Field(
+        ...,
+        min_length=8,
+        max_length=PASSWORD_MAX_LENGTH,
+        description="Password (min 8 chars, must include uppercase, lowercase, digit)",
+    )
     role: str = Field(default="user", description="user or partner (admin created manually)")
 
+    normalize_email = field_validator("email", mode="before")(_normalize_email)
+
+    # Same rules as the domain value objects, applied before the request
+    # reaches the service (no DB session, no bcrypt for bad input)
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        try:
+            return Email(v).value
+        except InvalidEmail as e:
+            raise ValueError(str(e))
+
+    @field_validator("password")
+    @classmethod
+    def validate_password(cls, v: str) -> str:
+        try:
+            Password(v)
+        except WeakPassword as e:
+            raise ValueError(str(e))
+        return v
+
     @field_validator("role")
     @classmethod
     def validate_role(cls, v: str) -> str:
@@ -27,7 +62,9 @@ class UserRegister(BaseModel):
 class UserLogin(BaseModel):
     """User login request"""
     email: str = Field(..., description="Email address")
-    password: str = Field(..., description="Password")
+    password: str = Field(..., max_length=PASSWORD_MAX_LENGTH, description="Password")
+
+    normalize_email = field_validator("email", mode="before")(_normalize_email)
 
 
 class VerifyEmail(BaseModel):
@@ -6,10 +6,13 @@ from datetime import datetime, timezone
 from typing import Tuple
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from services.auth.src.core.email_service import get_email_service
-from services.auth.src.core.jwt_utils import create_access_token, create_refresh_token
+from services.auth.src.core.email_queue import EmailJob, get_email_queue
+from services.auth.src.core.jwt_utils import (
+    create_access_token, create_refresh_token, decode_user_id, verify_refresh_token
+)
+from services.auth.src.core.password_hasher import get_password_hasher
 from services.auth.src.domain.user import (
     User, VerificationToken, Email, Password,
     DomainError, ValidationError, InvalidEmail, WeakPassword,
@@ -24,13 +27,14 @@ from services.auth.src.repo.verification_token import VerificationTokenRepositor
 class AuthService:
     """Service for authentication operations"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.user_repo = UserRepository(db)
         self.token_repo = VerificationTokenRepository(db)
-        self.email_service = get_email_service()
+        self.email_queue = get_email_queue()
+        self.password_hasher = get_password_hasher()
 
-    def register(self, email: str, password: str, role: str = "user") -> Tuple[UserORM, str]:
+    async def register(self, email: str, password: str, role: str = "user") -> Tuple[UserORM, str]:
         """
         Register a new user
 
@@ -42,9 +46,9 @@ class AuthService:
             WeakPassword: If password doesn't meet requirements
             UserExists: If user with email already exists
         """
-        # Validate email doesn't exist
-        if self.user_repo.exists_by_email(email):
-            raise UserExists(f"User with email {email} already exists")
+        # Validate the password before spending a bcrypt round on it,
+        # then hash on the process pool so the event loop isn't blocked
+        password_hash = await self.password_hasher.hash(Password(password))
 
         # Create domain user (validates email and password)
         try:
@@ -52,24 +56,25 @@ class AuthService:
                 email=email,
                 password=password,
                 role=role,
+                password_hash=password_hash,
             )
         except (InvalidEmail, WeakPassword) as e:
             raise e
 
-        # Save to database
-        orm_user = self.user_repo.save(domain_user)
+        # Save to database (raises UserExists if the email is taken)
+        orm_user = await self.user_repo.save(domain_user)
 
-        # Create and send verification email
+        # Create token and queue verification email
         if True:  # Email verification enabled by default
             token = VerificationToken.create(domain_user.id, validity_hours=24)
-            self.token_repo.save(token)
+            await self.token_repo.save(token)
 
-            # Send verification email
-            self.email_service.send_verification_email(
+            # Queue verification email (delivered by background workers)
+            self.email_queue.enqueue(EmailJob(
                 email=email,
                 verification_token=token.token,
                 user_id=domain_user.id,
-            )
+            ))
 
         message = (
             "Registration successful. "
@@ -78,7 +83,7 @@ class AuthService:
 
         return orm_user, message
 
-    def login(self, email: str, password: str) -> Tuple[UserORM, str, str]:
+    async def login(self, email: str, password: str) -> Tuple[UserORM, str, str]:
         """
         Login user with email and password
 
@@ -89,12 +94,12 @@ class AuthService:
             InvalidCredentials: If email doesn't exist or password is wrong
         """
         # Find user by email
-        user = self.user_repo.get_by_email(email)
+        user = await self.user_repo.get_by_email(email)
         if not user:
             raise InvalidCredentials("Invalid email or password")
 
         # Verify password
-        if not Password.verify(password, user.password_hash):
+        if not await self.password_hasher.verify(password, user.password_hash):
             raise InvalidCredentials("Invalid email or password")
 
         # Generate tokens
@@ -103,7 +108,7 @@ class AuthService:
 
         return user, access_token, refresh_token
 
-    def verify_email(self, token_str: str) -> UserORM:
+    async def verify_email(self, token_str: str) -> UserORM:
         """
         Verify user's email using verification token
 
@@ -114,7 +119,7 @@ class AuthService:
             VerificationFailed: If token is invalid or expired
         """
         # Get token from database
-        token_orm = self.token_repo.get_by_token(token_str)
+        token_orm = await self.token_repo.get_by_token(token_str)
         if not token_orm:
             raise VerificationFailed("Invalid verification token")
 
@@ -126,23 +131,24 @@ class AuthService:
             raise VerificationFailed("Verification token already used")
 
         # Get user and update
-        user = self.user_repo.get_by_id(token_orm.user_id)
+        user = await self.user_repo.get_by_id(token_orm.user_id)
         if not user:
             raise UserNotFound(f"User {token_orm.user_id} not found")
 
+        # Mark token as used - fails if a concurrent request consumed it first
+        if not await self.token_repo.mark_as_used(token_str):
+            raise VerificationFailed("Verification token already used or invalid")
+
         # Mark user as verified
-        updated_user = self.user_repo.update(
+        updated_user = await self.user_repo.update(
             token_orm.user_id,
             is_verified=True,
             updated_at=datetime.now(timezone.utc),
         )
 
-        # Mark token as used
-        self.token_repo.mark_as_used(token_str)
-
         return updated_user
 
-    def refresh_access_token(self, refresh_token: str) -> Tuple[str, str]:
+    async def refresh_access_token(self, refresh_token: str) -> Tuple[str, str]:
         """
         Create new access token using refresh token
 
@@ -152,16 +158,14 @@ class AuthService:
         Raises:
             InvalidCredentials: If refresh token is invalid or expired
         """
-        from services.auth.src.core.jwt_utils import verify_refresh_token
-
         # Verify refresh token
         payload = verify_refresh_token(refresh_token)
         if not payload:
             raise InvalidCredentials("Invalid or expired refresh token")
 
         # Get user
-        user_id = UUID(payload["user_id"])
-        user = self.user_repo.get_by_id(user_id)
+        user_id = decode_user_id(payload["uid"])
+        user = await self.user_repo.get_by_id(user_id)
         if not user:
             raise UserNotFound(f"User {user_id} not found")
 
@@ -172,9 +176,9 @@ class AuthService:
         # For now, we'll reuse the existing refresh token
         return new_access_token, refresh_token
 
-    def get_user(self, user_id: UUID) -> UserORM:
+    async def get_user(self, user_id: UUID) -> UserORM:
         """Get user by ID"""
-        user = self.user_repo.get_by_id(user_id)
+        user = await self.user_repo.get_by_id(user_id)
         if not user:
             raise UserNotFound(f"User {user_id} not found")
         return user
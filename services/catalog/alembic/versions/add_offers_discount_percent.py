@@ -0,0 +1,36 @@
+"""Add generated discount_percent column to offers
+
+Revision ID: add_offers_discount_percent
+Revises: create_user_history_partnership
+Create Date: 2024-01-20 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_offers_discount_percent'
+down_revision = 'create_user_history_partnership'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Kept in sync with OfferORM.discount_percent and domain discount_percent()
+    op.add_column(
+        'offers',
+        sa.Column(
+            'discount_percent',
+            sa.SmallInteger(),
+            sa.Computed(
+                "CASE WHEN price_amount >= original_price_amount THEN 0 "
+                "ELSE round((original_price_amount - price_amount) * 100 / original_price_amount) END",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('offers', 'discount_percent')
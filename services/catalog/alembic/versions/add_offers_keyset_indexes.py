@@ -0,0 +1,47 @@
+"""Extend the offer list indexes with id for keyset pagination
+
+Revision ID: add_offers_keyset_indexes
+Revises: add_offers_list_indexes
+Create Date: 2024-01-22 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_offers_keyset_indexes'
+down_revision = 'add_offers_list_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # List pages seek on (sort key, id); the trailing id lets the index both
+    # match the row-value predicate and return rows already in order
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_offers_active_pickup_end_id', 'offers', ['pickup_end', 'id'],
+            postgresql_where=sa.text("status = 'ACTIVE'"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_offers_place_created_at_id', 'offers', ['place_id', 'created_at', 'id'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_offers_active_pickup_end', table_name='offers', postgresql_concurrently=True)
+        op.drop_index('ix_offers_place_created_at', table_name='offers', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_offers_active_pickup_end', 'offers', ['pickup_end'],
+            postgresql_where=sa.text("status = 'ACTIVE'"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_offers_place_created_at', 'offers', ['place_id', 'created_at'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_offers_place_created_at_id', table_name='offers', postgresql_concurrently=True)
+        op.drop_index('ix_offers_active_pickup_end_id', table_name='offers', postgresql_concurrently=True)
@@ -0,0 +1,38 @@
+"""Index the customer and partner offer list queries
+
+Revision ID: add_offers_list_indexes
+Revises: add_offers_discount_percent
+Create Date: 2024-01-21 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_offers_list_indexes'
+down_revision = 'add_offers_discount_percent'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the offers table writable while the indexes build
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_offers_active_pickup_end', 'offers', ['pickup_end'],
+            postgresql_where=sa.text("status = 'ACTIVE'"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_offers_place_created_at', 'offers', ['place_id', 'created_at'],
+            postgresql_concurrently=True,
+        )
+        # Covered by the (place_id, created_at) prefix
+        op.drop_index('ix_offers_place_id', table_name='offers', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_offers_place_id', 'offers', ['place_id'], postgresql_concurrently=True)
+        op.drop_index('ix_offers_place_created_at', table_name='offers', postgresql_concurrently=True)
+        op.drop_index('ix_offers_active_pickup_end', table_name='offers', postgresql_concurrently=True)
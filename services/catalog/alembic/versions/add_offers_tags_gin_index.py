@@ -0,0 +1,38 @@
+"""Index offer tags for the tag filter and default the array columns to empty
+
+Revision ID: add_offers_tags_gin_index
+Revises: add_server_default_timestamps
+Create Date: 2024-01-24 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_offers_tags_gin_index'
+down_revision = 'add_server_default_timestamps'
+branch_labels = None
+depends_on = None
+
+_ARRAY_COLUMNS = ('tags', 'allergens', 'image_urls')
+
+
+def upgrade() -> None:
+    for column in _ARRAY_COLUMNS:
+        op.alter_column('offers', column, server_default=sa.text("'{}'"))
+
+    # GIN serves tags @> ARRAY[...] (the tag filter of GET /offers)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_offers_tags_gin', 'offers', ['tags'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_offers_tags_gin', table_name='offers', postgresql_concurrently=True)
+
+    for column in _ARRAY_COLUMNS:
+        op.alter_column('offers', column, server_default=None)
@@ -0,0 +1,32 @@
+"""Let Postgres set created_at/updated_at of user_history and partnerships
+
+Revision ID: add_server_default_timestamps
+Revises: add_offers_keyset_indexes
+Create Date: 2024-01-23 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_server_default_timestamps'
+down_revision = 'add_offers_keyset_indexes'
+branch_labels = None
+depends_on = None
+
+_COLUMNS = (
+    ('user_history', 'created_at'),
+    ('partnerships', 'created_at'),
+    ('partnerships', 'updated_at'),
+)
+
+
+def upgrade() -> None:
+    # Metadata-only change: existing rows are not rewritten
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=None)
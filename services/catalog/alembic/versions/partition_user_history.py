@@ -0,0 +1,98 @@
+"""Partition user_history by month of created_at
+
+Revision ID: partition_user_history
+Revises: add_offers_tags_gin_index
+Create Date: 2024-01-25 00:00:00.000000
+
+"""
+from datetime import date, datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = 'partition_user_history'
+down_revision = 'add_offers_tags_gin_index'
+branch_labels = None
+depends_on = None
+
+# Monthly partitions created up front, starting with the current month.
+# Later months are created by the catalog's partition maintenance (core/partitions.py)
+_MONTHS_AHEAD = 12
+
+_COLUMNS = ('id', 'user_id', 'offer_id', 'action', 'details', 'created_at')
+
+
+def _create_table(name: str, *args, **kw) -> None:
+    op.create_table(
+        name,
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('offer_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('action', postgresql.ENUM(name='user_action', create_type=False), nullable=False),
+        sa.Column('details', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        *args,
+        **kw,
+    )
+
+
+def _copy_rows(source: str, target: str) -> None:
+    columns = ', '.join(_COLUMNS)
+    op.execute(f'INSERT INTO {target} ({columns}) SELECT {columns} FROM {source}')
+
+
+def _month_starts(first: date, count: int) -> list[date]:
+    months = []
+    year, month = first.year, first.month
+    for _ in range(count + 1):
+        months.append(date(year, month, 1))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def upgrade() -> None:
+    # The partition key has to be part of the primary key
+    _create_table(
+        'user_history_partitioned',
+        sa.PrimaryKeyConstraint('id', 'created_at', name='user_history_pkey_new'),
+        postgresql_partition_by='RANGE (created_at)',
+    )
+
+    bounds = _month_starts(datetime.now(timezone.utc).date(), _MONTHS_AHEAD)
+    for start, end in zip(bounds, bounds[1:]):
+        op.execute(
+            f"CREATE TABLE user_history_{start:%Y_%m} PARTITION OF user_history_partitioned "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    # Catches rows outside the created months (older history, months not created yet)
+    op.execute('CREATE TABLE user_history_default PARTITION OF user_history_partitioned DEFAULT')
+
+    _copy_rows('user_history', 'user_history_partitioned')
+    op.drop_table('user_history')
+    op.rename_table('user_history_partitioned', 'user_history')
+    op.execute('ALTER TABLE user_history RENAME CONSTRAINT user_history_pkey_new TO user_history_pkey')
+
+    # Indexes on the parent are created on every partition. idx_user_history_user_id
+    # is not recreated: (user_id, created_at DESC) serves the same lookups
+    op.create_index('idx_user_history_offer_id', 'user_history', ['offer_id'])
+    op.create_index('idx_user_history_action', 'user_history', ['action'])
+    op.create_index('idx_user_history_created_at', 'user_history', ['created_at'])
+    op.create_index(
+        'idx_user_history_user_created', 'user_history', ['user_id', sa.text('created_at DESC')]
+    )
+
+
+def downgrade() -> None:
+    _create_table('user_history_plain', sa.PrimaryKeyConstraint('id', name='user_history_pkey_new'))
+    _copy_rows('user_history', 'user_history_plain')
+    op.drop_table('user_history')  # drops the partitions too
+    op.rename_table('user_history_plain', 'user_history')
+    op.execute('ALTER TABLE user_history RENAME CONSTRAINT user_history_pkey_new TO user_history_pkey')
+
+    op.create_index('idx_user_history_user_id', 'user_history', ['user_id'])
+    op.create_index('idx_user_history_offer_id', 'user_history', ['offer_id'])
+    op.create_index('idx_user_history_action', 'user_history', ['action'])
+    op.create_index('idx_user_history_created_at', 'user_history', ['created_at'])
+    op.create_index('idx_user_history_user_created', 'user_history', ['user_id', 'created_at'])
@@ -2,18 +2,22 @@
 Offers API endpoints.
 Handles HTTP layer: request validation, response formatting, error handling.
 """
-from typing import Annotated
+from collections import OrderedDict
+from typing import Annotated, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, Path, status
+from fastapi import APIRouter, Header, HTTPException, Query, Path, Response, status
+from pydantic import TypeAdapter
 
 from services.catalog.src.core.dependencies import (
-    DBSession, PartnerUser, CustomerUser, AuthUser
+    AuthContext, CustomerContext, PartnerContext
 )
+from services.catalog.src.core.list_cache import get_offer_list_cache
+from services.catalog.src.core.pagination import Cursor, decode_cursor, encode_cursor
 from services.catalog.src.services.offers import OfferService
 from services.catalog.src.schemas.offer import (
     OfferOut, OfferCreate, OfferUpdate, OfferReserve,
-    OfferListOut, ReservationOut, MoneyOut
+    OfferListOut, OfferSummaryOut, OfferSummaryListOut, ReservationOut
 )
 from services.catalog.src.domain.offer import (
     DomainError, ValidationError, NotAvailableError, InsufficientQuantityError
@@ -23,46 +27,156 @@ from services.catalog.src.domain.offer import (
 router = APIRouter(prefix="/offers", tags=["offers"])
 
 
+def _offer_fields(offer) -> dict:
+    """Flatten a domain Offer into OfferOut input"""
+    return {
+        "id": offer.id,
+        "place_id": offer.place_id,
+        "title": offer.title,
+        "description": offer.description,
+        "price": {"amount": offer.price.amount, "currency": offer.price.currency},
+        "original_price": {
+            "amount": offer.original_price.amount,
+            "currency": offer.original_price.currency,
+        },
+        "discount_percent": offer.discount_percent(),
+        "quantity_total": offer.quantity_total,
+        "quantity_available": offer.quantity_available,
+        "pickup_start": offer.pickup_start,
+        "pickup_end": offer.pickup_end,
+        "status": offer.status.value,
+        "tags": offer.tags,
+        "allergens": offer.allergens,
+        "image_urls": offer.image_urls,
+        "created_at": offer.created_at,
+        "updated_at": offer.updated_at,
+    }
+
+
+# Built once: validates a whole page in a single pydantic-core call
+OFFER_LIST_ADAPTER = TypeAdapter(list[OfferOut])
+
+
 def domain_to_schema(offer) -> OfferOut:
     """Convert domain Offer to API schema OfferOut"""
-    return OfferOut(
-        id=offer.id,
-        place_id=offer.place_id,
-        title=offer.title,
-        description=offer.description,
-        price=MoneyOut(amount=offer.price.amount, currency=offer.price.currency),
-        original_price=MoneyOut(
-            amount=offer.original_price.amount,
-            currency=offer.original_price.currency
-        ),
-        discount_percent=offer.discount_percent(),
-        quantity_total=offer.quantity_total,
-        quantity_available=offer.quantity_available,
-        pickup_start=offer.pickup_start,
-        pickup_end=offer.pickup_end,
-        status=offer.status.value,
-        tags=offer.tags,
-        allergens=offer.allergens,
-        image_urls=offer.image_urls,
-        created_at=offer.created_at,
-        updated_at=offer.updated_at,
-    )
+    return OfferOut(**_offer_fields(offer))
+
+
+def _row_fields(row) -> dict:
+    """Shape an offers table row from OfferService (get_offer, get_partner_offers) into OfferOut input"""
+    return {
+        "id": row.id,
+        "place_id": row.place_id,
+        "title": row.title,
+        "description": row.description,
+        "price": {"amount": row.price_amount, "currency": row.price_currency},
+        "original_price": {
+            "amount": row.original_price_amount,
+            "currency": row.original_price_currency,
+        },
+        "discount_percent": row.discount_percent,
+        "quantity_total": row.quantity_total,
+        "quantity_available": row.quantity_available,
+        "pickup_start": row.pickup_start,
+        "pickup_end": row.pickup_end,
+        "status": row.status.value,
+        "tags": row.tags,
+        "allergens": row.allergens,
+        "image_urls": row.image_urls,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+    }
+
+
+def row_to_schema(row) -> OfferOut:
+    """Convert an offers table row to OfferOut"""
+    return OfferOut(**_row_fields(row))
+
+
+# Serialized OfferOut of recently served offers, keyed by (id, updated_at,
+# status). Every write bumps updated_at, and status is in the key because an
+# offer turns expired with time alone, so an entry is never stale.
+_DETAIL_CACHE_SIZE = 1024
+_detail_bodies: OrderedDict[tuple, bytes] = OrderedDict()
+
+
+def _detail_etag(row) -> str:
+    return f'W/"{row.updated_at.timestamp()}-{row.status.value}"'
+
+
+def _detail_body(row) -> bytes:
+    """OfferOut JSON of an offers table row, memoized per offer version"""
+    key = (row.id, row.updated_at, row.status)
+    body = _detail_bodies.get(key)
+    if body is not None:
+        _detail_bodies.move_to_end(key)
+        return body
+    offer = row_to_schema(row)
+    body = offer.__pydantic_serializer__.to_json(offer)
+    _detail_bodies[key] = body
+    if len(_detail_bodies) > _DETAIL_CACHE_SIZE:
+        _detail_bodies.popitem(last=False)
+    return body
+
+
+def rows_to_schema(rows) -> list[OfferOut]:
+    """Convert a page of offers table rows to OfferOut"""
+    return OFFER_LIST_ADAPTER.validate_python([_row_fields(r) for r in rows])
+
+
+def _summary_fields(row: dict) -> dict:
+    """Shape a summary row from OfferService.list_offers into OfferSummaryOut input"""
+    return {
+        "id": row["id"],
+        "place_id": row["place_id"],
+        "title": row["title"],
+        "price": {"amount": row["price_amount"], "currency": row["price_currency"]},
+        "original_price": {
+            "amount": row["original_price_amount"],
+            "currency": row["original_price_currency"],
+        },
+        "discount_percent": row["discount_percent"],
+        "quantity_total": row["quantity_total"],
+        "quantity_available": row["quantity_available"],
+        "pickup_start": row["pickup_start"],
+        "pickup_end": row["pickup_end"],
+        "status": row["status"].value,
+        "image_url": row["image_url"],
+    }
+
+
+OFFER_SUMMARY_LIST_ADAPTER = TypeAdapter(list[OfferSummaryOut])
+
+
+def rows_to_summaries(rows) -> list[OfferSummaryOut]:
+    """Convert a page of summary rows to OfferSummaryOut"""
+    return OFFER_SUMMARY_LIST_ADAPTER.validate_python([_summary_fields(r) for r in rows])
+
+
+def _parse_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    """Decode the ?cursor= query parameter (400 if it was tampered with)"""
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 
 # ========== USER ENDPOINTS (Customers) ==========
 
 @router.get(
     "",
-    response_model=OfferListOut,
+    response_model=OfferSummaryListOut,
     summary="List offers",
     description="Get list of available offers for customers. Shows only ACTIVE offers by default.",
 )
-def list_offers(
-    db: DBSession,
-    user: CustomerUser,
+async def list_offers(
+    ctx: CustomerContext,
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
-    offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[Optional[str], Query(description="next_cursor of the previous page")] = None,
     active_only: Annotated[bool, Query()] = True,
+    tag: Annotated[Optional[str], Query(min_length=1, max_length=50, description="Only offers with this tag")] = None,
 ):
     """
     **User Role Required**
@@ -70,19 +184,39 @@ def list_offers(
     List all available offers with pagination.
     - Only ACTIVE offers are shown by default
     - Sorted by pickup_end (soonest expiring first)
+    - Pass `next_cursor` back as `cursor` for the next page
+    - `tag` narrows the list to offers with that tag (case-insensitive)
+    - `total_estimate` (first page without `tag` only) is the planner's
+      estimate of the number of offers, not an exact count
     - Expired offers are automatically filtered out
+    - Offers are returned as compact cards (no description, tags,
+      allergens; first image only) - use GET /offers/{offer_id} for details
+    - Pages are the same for every customer and are cached for a few seconds
     """
+    cache = get_offer_list_cache()
+    if tag is not None:
+        tag = tag.strip().lower()  # stored tags are normalized the same way
+    key = (limit, cursor, active_only, tag)
+    body = cache.get(key)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+
     try:
-        service = OfferService(db)
-        offers = service.list_offers(limit=limit, offset=offset, active_only=active_only)
-        total = service.count_offers()
+        version = cache.version
+        service = OfferService(ctx.db)
+        offers, total_estimate, next_cursor = await service.list_offers(
+            limit=limit, cursor=_parse_cursor(cursor), active_only=active_only, tag=tag
+        )
 
-        return OfferListOut(
-            offers=[domain_to_schema(o) for o in offers],
-            total=total,
+        page = OfferSummaryListOut(
+            offers=rows_to_summaries(offers),
+            total_estimate=total_estimate,
             limit=limit,
-            offset=offset,
+            next_cursor=encode_cursor(next_cursor) if next_cursor else None,
         )
+        body = page.__pydantic_serializer__.to_json(page)
+        cache.set(key, body, version=version)
+        return Response(content=body, media_type="application/json")
     except DomainError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -93,23 +227,30 @@ def list_offers(
     summary="Get offer details",
     description="Get detailed information about a specific offer",
 )
-def get_offer(
+async def get_offer(
     offer_id: Annotated[UUID, Path()],
-    db: DBSession,
-    user: AuthUser,  # Any authenticated user can view
+    ctx: AuthContext,  # Any authenticated user can view
+    if_none_match: Annotated[Optional[str], Header()] = None,
 ):
     """
     **Authentication Required**
 
     Get full details of a specific offer by ID.
+
+    The response carries an ETag; send it back as If-None-Match to get
+    304 Not Modified (no body) while the offer is unchanged.
     """
-    service = OfferService(db)
-    offer = service.get_offer(offer_id)
+    service = OfferService(ctx.db)
+    row = await service.get_offer(offer_id)
 
-    if not offer:
+    if not row:
         raise HTTPException(status_code=404, detail=f"Offer {offer_id} not found")
 
-    return domain_to_schema(offer)
+    etag = _detail_etag(row)
+    if if_none_match is not None and etag in (t.strip() for t in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    return Response(content=_detail_body(row), media_type="application/json", headers={"ETag": etag})
 
 
 @router.post(
@@ -119,11 +260,10 @@ def get_offer(
     summary="Reserve offer",
     description="Reserve a quantity of items from an offer",
 )
-def reserve_offer(
+async def reserve_offer(
     offer_id: Annotated[UUID, Path()],
     data: OfferReserve,
-    db: DBSession,
-    user: CustomerUser,
+    ctx: CustomerContext,
 ):
     """
     **User Role Required**
@@ -141,8 +281,8 @@ def reserve_offer(
     3. Release reservation if payment not completed in time
     """
     try:
-        service = OfferService(db)
-        offer = service.reserve_offer(offer_id, data.quantity, user.user_id)
+        service = OfferService(ctx.db)
+        offer = await service.reserve_offer(offer_id, data.quantity, ctx.user.user_id)
 
         return ReservationOut(
             offer_id=offer.id,
@@ -169,10 +309,9 @@ def reserve_offer(
     summary="Create offer",
     description="Create a new offer (partners only)",
 )
-def create_offer(
+async def create_offer(
     data: OfferCreate,
-    db: DBSession,
-    partner: PartnerUser,
+    ctx: PartnerContext,
 ):
     """
     **Partner Role Required**
@@ -183,8 +322,8 @@ def create_offer(
     Update it to "active" status to make it visible to customers.
     """
     try:
-        service = OfferService(db)
-        offer = service.create_offer(partner.place_id, data)
+        service = OfferService(ctx.db)
+        offer = await service.create_offer(ctx.user.place_id, data)
 
         return domain_to_schema(offer)
     except ValidationError as e:
@@ -199,11 +338,10 @@ def create_offer(
     summary="Update offer",
     description="Update an existing offer (partners only)",
 )
-def update_offer(
+async def update_offer(
     offer_id: Annotated[UUID, Path()],
     data: OfferUpdate,
-    db: DBSession,
-    partner: PartnerUser,
+    ctx: PartnerContext,
 ):
     """
     **Partner Role Required**
@@ -215,8 +353,8 @@ def update_offer(
     Cannot update cancelled or expired offers.
     """
     try:
-        service = OfferService(db)
-        offer = service.update_offer(offer_id, partner.place_id, data)
+        service = OfferService(ctx.db)
+        offer = await service.update_offer(offer_id, ctx.user.place_id, data)
 
         return domain_to_schema(offer)
     except NotAvailableError as e:
@@ -233,10 +371,9 @@ def update_offer(
     summary="Delete offer",
     description="Delete an offer (partners only)",
 )
-def delete_offer(
+async def delete_offer(
     offer_id: Annotated[UUID, Path()],
-    db: DBSession,
-    partner: PartnerUser,
+    ctx: PartnerContext,
 ):
     """
     **Partner Role Required**
@@ -246,8 +383,8 @@ def delete_offer(
     Cannot delete offers with active reservations - cancel them instead.
     """
     try:
-        service = OfferService(db)
-        deleted = service.delete_offer(offer_id, partner.place_id)
+        service = OfferService(ctx.db)
+        deleted = await service.delete_offer(offer_id, ctx.user.place_id)
 
         if not deleted:
             raise HTTPException(status_code=404, detail=f"Offer {offer_id} not found")
@@ -267,28 +404,32 @@ def delete_offer(
     summary="Get my offers",
     description="Get all offers for the authenticated partner's place",
 )
-def get_my_offers(
-    db: DBSession,
-    partner: PartnerUser,
+async def get_my_offers(
+    ctx: PartnerContext,
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
-    offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[Optional[str], Query(description="next_cursor of the previous page")] = None,
 ):
     """
     **Partner Role Required**
 
-    Get all offers for your place (dashboard view).
+    Get all offers for your place (dashboard view), newest first.
     Shows offers in all statuses (draft, active, paused, etc.)
+    Pass `next_cursor` back as `cursor` for the next page; `total` is only
+    counted on the first page.
     """
     try:
-        service = OfferService(db)
-        offers = service.get_partner_offers(partner.place_id, limit=limit, offset=offset)
-        total = len(offers)  # Simple count; improve with dedicated query
+        after = _parse_cursor(cursor)
+        service = OfferService(ctx.db)
+        offers, next_cursor = await service.get_partner_offers(
+            ctx.user.place_id, limit=limit, cursor=after
+        )
+        total = await service.count_partner_offers(ctx.user.place_id) if after is None else None
 
         return OfferListOut(
-            offers=[domain_to_schema(o) for o in offers],
+            offers=rows_to_schema(offers),
             total=total,
             limit=limit,
-            offset=offset,
+            next_cursor=encode_cursor(next_cursor) if next_cursor else None,
         )
     except DomainError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -1,25 +1,66 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from functools import lru_cache
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
 from services.catalog.src.core.settings import settings
 
-_engine = None
-_session_local = None
-
-def get_engine():
-    """Lazily create and return the database engine"""
-    global _engine
-    if _engine is None:
-        _engine = create_engine(settings.database_url, pool_pre_ping=True)
-    return _engine
-
-def get_session_local():
-    """Lazily create and return the SessionLocal factory"""
-    global _session_local
-    if _session_local is None:
-        _session_local = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
-    return _session_local
-
-# For backwards compatibility - these will be created lazily
-engine = None  # Will be created lazily
-SessionLocal = None  # Will be created lazily
+
+def _async_database_url(url: str) -> str:
+    """Route plain postgresql:// URLs through the asyncpg driver"""
+    return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+
+def _connect_args() -> dict:
+    """
+    Prepared statement settings for asyncpg.
+
+    Each pooled connection prepares a statement once and reuses it, so the
+    hot offer queries skip parse/plan on later calls. PgBouncer in
+    transaction mode moves clients between server connections, where those
+    names do not exist: there, statements get unique names and are not kept.
+    """
+    if settings.db_pgbouncer:
+        return {
+            "prepared_statement_cache_size": 0,
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return {"prepared_statement_cache_size": settings.db_statement_cache_size}
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """Lazily create and return the async database engine (app-wide singleton)"""
+    return create_async_engine(
+        _async_database_url(settings.database_url),
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_pool_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=True,
+        connect_args=_connect_args(),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_session_local() -> async_sessionmaker:
+    """Lazily create and return the AsyncSession factory (app-wide singleton)"""
+    return async_sessionmaker(bind=get_engine(), autoflush=False, expire_on_commit=False)
+
+
+async def dispose_engine() -> None:
+    """Close all pooled connections (called on application shutdown)"""
+    if get_engine.cache_info().currsize:
+        await get_engine().dispose()
+    get_session_local.cache_clear()
+    get_engine.cache_clear()
+
+
+def __getattr__(name: str):
+    """Resolve `engine` / `SessionLocal` on first access without building them at import time"""
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_local()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,38 +1,37 @@
 """
 Core dependencies for FastAPI dependency injection.
-Includes database session management and authentication stubs.
+Includes database session management and authentication.
 """
 from __future__ import annotations
 
-from typing import Annotated, Literal, Generator
+from typing import Annotated, AsyncGenerator, Literal, Optional, get_args
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, Header
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.catalog.src.core.db import get_session_local
+from services.catalog.src.core.jwt_utils import decode_user_id, verify_access_token
 
 
 # ========== Database Session ==========
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Provide database session with automatic cleanup"""
     session_local = get_session_local()
-    db = session_local()
-    try:
+    async with session_local() as db:
         yield db
-    finally:
-        db.close()
 
 
-DBSession = Annotated[Session, Depends(get_db)]
+DBSession = Annotated[AsyncSession, Depends(get_db)]
 
 
-# ========== Authentication Stubs ==========
-# In production, this would validate JWT tokens with the Auth service
-# For now, we'll use simple header-based auth for demonstration
+# ========== Authentication ==========
+# Access tokens from the auth service are verified locally (see jwt_utils);
+# the user comes straight from the token claims, without a DB lookup
 
 Role = Literal["user", "partner", "admin"]
+_ROLES = frozenset(get_args(Role))
 
 
 class CurrentUser:
@@ -58,43 +57,53 @@ class CurrentUser:
 
 
 def get_current_user(
-    x_user_id: str = Header(..., description="User ID"),
-    x_user_email: str = Header(..., description="User email"),
-    x_user_role: Role = Header(..., description="User role: user, partner, or admin"),
-    x_place_id: str | None = Header(None, description="Place ID (for partners)"),
+    authorization: Annotated[Optional[str], Header()] = None,
+    x_place_id: UUID | None = Header(None, description="Place ID (for partners)"),
 ) -> CurrentUser:
     """
-    Extract current user from headers.
-
-    In production, replace this with JWT token validation from Auth service:
-    - Parse Authorization: Bearer <token>
-    - Call auth service to validate token
-    - Extract claims (user_id, email, role, place_id)
-    - Return CurrentUser
+    Extract current user from Authorization header (Bearer token)
 
-    For now, we trust headers for development/testing.
+    Partners select the place they act for with X-Place-Id; access tokens
+    carry no place claim.
     """
+    if not authorization:
+        raise HTTPException(status_code=401, detail="Missing authorization header")
+
+    # Expected format: "Bearer <token>"
+    scheme, sep, token = authorization.partition(" ")
+    if not sep or scheme.lower() != "bearer" or not token:
+        raise HTTPException(status_code=401, detail="Invalid authorization header format")
+
+    payload = verify_access_token(token)
+    if not payload:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+
     try:
-        user_id = UUID(x_user_id)
-        place_id = UUID(x_place_id) if x_place_id else None
+        user_id = decode_user_id(payload["uid"])
+        role = payload["role"]
+        if role not in _ROLES:
+            raise ValueError(f"unknown role {role!r}")
         return CurrentUser(
             user_id=user_id,
-            email=x_user_email,
-            role=x_user_role,
-            place_id=place_id
+            email=payload.get("email", ""),
+            role=role,
+            place_id=x_place_id,
         )
-    except (ValueError, AttributeError) as e:
-        raise HTTPException(status_code=401, detail=f"Invalid user credentials: {e}")
+    except (KeyError, ValueError) as e:
+        raise HTTPException(status_code=401, detail=f"Invalid token claims: {e}")
 
 
-def require_admin(user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
+AuthUser = Annotated[CurrentUser, Depends(get_current_user)]
+
+
+def require_admin(user: AuthUser) -> CurrentUser:
     """Require admin role"""
     if not user.is_admin():
         raise HTTPException(status_code=403, detail="Admin role required")
     return user
 
 
-def require_partner(user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
+def require_partner(user: AuthUser) -> CurrentUser:
     """Require partner role"""
     if not user.is_partner():
         raise HTTPException(status_code=403, detail="Partner role required")
@@ -103,7 +112,7 @@ def require_partner(user: CurrentUser = Depends(get_current_user)) -> CurrentUse
     return user
 
 
-def require_user(user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
+def require_user(user: AuthUser) -> CurrentUser:
     """Require user role (customer)"""
     if not user.is_user():
         raise HTTPException(status_code=403, detail="User role required")
@@ -111,7 +120,34 @@ def require_user(user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
 
 
 # Type aliases for dependencies
-AuthUser = Annotated[CurrentUser, Depends(get_current_user)]
 AdminUser = Annotated[CurrentUser, Depends(require_admin)]
 PartnerUser = Annotated[CurrentUser, Depends(require_partner)]
 CustomerUser = Annotated[CurrentUser, Depends(require_user)]
+
+
+# ========== Request Context ==========
+# Session and user in one dependency. The session is opened only after the
+# role check has passed, so rejected requests (401/403) never build one.
+
+class RequestContext:
+    """DB session bound to the authenticated user of the request"""
+    __slots__ = ("db", "user")
+
+    def __init__(self, db: AsyncSession, user: CurrentUser):
+        self.db = db
+        self.user = user
+
+
+def _request_context(user_dependency):
+    """Build a context dependency on top of one of the user dependencies"""
+    async def get_ctx(
+        user: CurrentUser = Depends(user_dependency),
+    ) -> AsyncGenerator[RequestContext, None]:
+        async with get_session_local()() as db:
+            yield RequestContext(db, user)
+    return get_ctx
+
+
+AuthContext = Annotated[RequestContext, Depends(_request_context(get_current_user))]
+PartnerContext = Annotated[RequestContext, Depends(_request_context(require_partner))]
+CustomerContext = Annotated[RequestContext, Depends(_request_context(require_user))]
@@ -0,0 +1,57 @@
+"""
+Customer Offer List Cache
+GET /offers returns the same page to every customer, so serialized pages are
+kept for a few seconds to absorb bursts. Offer writes that change which offers
+are listed, or their order, bump a version that is part of every key: a page
+computed before such a write is never served after it (in this process; other
+workers catch up within the TTL). Reservations that leave stock only change
+quantity_available, which a cached page may show stale for up to the TTL.
+"""
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Hashable, Optional
+
+from services.catalog.src.core.settings import settings
+
+
+class ListCache:
+    """Small TTL + LRU cache of serialized responses with version invalidation"""
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.version = 0
+        self._entries: OrderedDict[tuple, tuple[float, bytes]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Cached body for key at the current version, if still fresh"""
+        entry = self._entries.get((self.version, key))
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at < time.monotonic():
+            del self._entries[(self.version, key)]
+            return None
+        self._entries.move_to_end((self.version, key))
+        return body
+
+    def set(self, key: Hashable, body: bytes, *, version: int) -> None:
+        """Store body computed at `version`; dropped if offers changed meanwhile"""
+        if self.ttl <= 0 or version != self.version:
+            return
+        self._entries[(version, key)] = (time.monotonic() + self.ttl, body)
+        self._entries.move_to_end((version, key))
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Offers changed: retire every cached page"""
+        self.version += 1
+        self._entries.clear()
+
+
+@lru_cache(maxsize=1)
+def get_offer_list_cache() -> ListCache:
+    """App-wide cache for GET /offers pages"""
+    return ListCache(ttl=settings.offer_list_cache_ttl)
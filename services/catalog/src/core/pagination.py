@@ -0,0 +1,31 @@
+"""
+Keyset Pagination Cursors
+List pages continue from the last row of the previous page: (sort key, id).
+Clients get that position as an opaque URL-safe string and send it back
+unchanged as ?cursor=.
+"""
+import base64
+from datetime import datetime
+from uuid import UUID
+
+Cursor = tuple[datetime, UUID]
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Encode a (sort key, id) position as an opaque string"""
+    sort_key, row_id = cursor
+    raw = f"{sort_key.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(value: str) -> Cursor:
+    """Decode a cursor from encode_cursor; raises ValueError if it is malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode()
+        sort_key, _, row_id = raw.partition("|")
+        cursor = (datetime.fromisoformat(sort_key), UUID(row_id))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if cursor[0].tzinfo is None:
+        raise ValueError("Invalid cursor")
+    return cursor
@@ -0,0 +1,101 @@
+"""
+user_history Partition Maintenance
+user_history is range-partitioned by month of created_at. A background task
+creates the partitions for the current month and the next few months ahead of
+time, at startup and then daily, so new rows never fall into
+user_history_default.
+
+A month's partition cannot be created once user_history_default holds rows of
+that month (e.g. the service was down across a month boundary). To recover,
+in one transaction:
+
+    ALTER TABLE user_history DETACH PARTITION user_history_default;
+    CREATE TABLE user_history_YYYY_MM PARTITION OF user_history
+        FOR VALUES FROM ('YYYY-MM-01') TO ('<next month>-01');
+    INSERT INTO user_history SELECT * FROM user_history_default
+        WHERE created_at >= 'YYYY-MM-01' AND created_at < '<next month>-01';
+    DELETE FROM user_history_default
+        WHERE created_at >= 'YYYY-MM-01' AND created_at < '<next month>-01';
+    ALTER TABLE user_history ATTACH PARTITION user_history_default DEFAULT;
+"""
+import asyncio
+import logging
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from services.catalog.src.core.db import get_engine
+from services.catalog.src.core.settings import settings
+
+logger = logging.getLogger("catalog.partitions")
+
+_CHECK_INTERVAL = 24 * 60 * 60  # seconds
+
+
+def _month_starts(first: date, count: int) -> list[date]:
+    """First days of `count` consecutive months from first's month, plus the one after"""
+    months = []
+    year, month = first.year, first.month
+    for _ in range(count + 1):
+        months.append(date(year, month, 1))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+async def ensure_user_history_partitions(months_ahead: int) -> None:
+    """Create the partitions of the current month and the next `months_ahead` months"""
+    bounds = _month_starts(datetime.now(timezone.utc).date(), months_ahead + 1)
+    for start, end in zip(bounds, bounds[1:]):
+        name = f"user_history_{start:%Y_%m}"
+        try:
+            async with get_engine().begin() as conn:
+                # Workers starting together would race on the same CREATE
+                await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('user_history_partitions'))"))
+                await conn.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF user_history "
+                    f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                ))
+        except DBAPIError:
+            logger.exception(
+                "Could not create partition %s; if user_history_default holds rows of "
+                "that month, move them as described in core/partitions.py", name
+            )
+
+
+class PartitionMaintainer:
+    """Background task keeping user_history partitions ahead of the clock"""
+
+    def __init__(self, months_ahead: int, interval: float = _CHECK_INTERVAL):
+        self.months_ahead = months_ahead
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Spawn the maintenance task on the running event loop (application startup)"""
+        self._task = asyncio.create_task(self._run(), name="user-history-partitions")
+
+    async def stop(self) -> None:
+        """Cancel the maintenance task"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await ensure_user_history_partitions(self.months_ahead)
+            except Exception:
+                # Database unreachable etc.: try again at the next interval
+                logger.exception("user_history partition maintenance failed")
+            await asyncio.sleep(self.interval)
+
+
+@lru_cache(maxsize=1)
+def get_partition_maintainer() -> PartitionMaintainer:
+    """App-wide partition maintainer"""
+    return PartitionMaintainer(months_ahead=settings.user_history_partition_months_ahead)
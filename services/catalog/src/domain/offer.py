@@ -15,6 +15,9 @@ def utcnow() -> datetime:
 
 
 def ensure_tzaware(dt: datetime, field_name: str) -> datetime:
+    # utcnow() and asyncpg both hand out timezone.utc; skip utcoffset() for those
+    if dt.tzinfo is timezone.utc:
+        return dt
     if dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None:
         raise ValueError(f"{field_name} must be timezone-aware (UTC recommended)")
     return dt
@@ -25,6 +28,14 @@ def quantize_money(amount: Decimal) -> Decimal:
     return amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
 
+def discount_percent(price_cents: int, original_cents: int) -> int:
+    """Integer discount percent of price vs original_price (0..100)"""
+    if original_cents == 0 or price_cents >= original_cents:
+        return 0
+    # round half up to the nearest int
+    return (200 * (original_cents - price_cents) + original_cents) // (2 * original_cents)
+
+
 # ---------- domain errors ----------
 
 class DomainError(Exception):
@@ -47,28 +58,44 @@ class InsufficientQuantityError(DomainError):
 
 @dataclass(frozen=True, slots=True)
 class Money:
-    amount: Decimal
+    """
+    Amount in minor units (kopecks/cents); every supported currency has 2 decimals.
+    Decimal only appears at the edges: `from_decimal` in, `amount` out.
+    """
+    amount_cents: int
     currency: str = "RUB"
 
     def __post_init__(self) -> None:
-        if not isinstance(self.amount, Decimal):
-            raise TypeError("Money.amount must be Decimal")
-        if self.amount < Decimal("0"):
+        if type(self.amount_cents) is not int:
+            raise TypeError("Money.amount_cents must be int")
+        if self.amount_cents < 0:
             raise ValidationError("Money.amount cannot be negative")
         if not self.currency or len(self.currency) not in (3,):
             raise ValidationError("Money.currency must be a 3-letter code like 'RUB'")
-        object.__setattr__(self, "amount", quantize_money(self.amount))
-        object.__setattr__(self, "currency", self.currency.upper())
+        if not self.currency.isupper():
+            object.__setattr__(self, "currency", self.currency.upper())
+
+    @classmethod
+    def from_decimal(cls, amount: Decimal, currency: str = "RUB") -> Money:
+        """Build from a major-unit Decimal (request/DB value), rounded to cents"""
+        if not isinstance(amount, Decimal):
+            raise TypeError("Money amount must be Decimal")
+        return cls(int(quantize_money(amount).scaleb(2)), currency)
+
+    @property
+    def amount(self) -> Decimal:
+        """Major-unit amount with 2 decimals, e.g. Decimal('299.00')"""
+        return Decimal(self.amount_cents).scaleb(-2)
 
     def __add__(self, other: Money) -> Money:
         self._assert_same_currency(other)
-        return Money(self.amount + other.amount, self.currency)
+        return Money(self.amount_cents + other.amount_cents, self.currency)
 
     def __sub__(self, other: Money) -> Money:
         self._assert_same_currency(other)
-        if self.amount < other.amount:
+        if self.amount_cents < other.amount_cents:
             raise ValidationError("Money subtraction would go negative")
-        return Money(self.amount - other.amount, self.currency)
+        return Money(self.amount_cents - other.amount_cents, self.currency)
 
     def _assert_same_currency(self, other: Money) -> None:
         if self.currency != other.currency:
@@ -84,6 +111,20 @@ class OfferStatus(str, Enum):
     CANCELLED = "cancelled"  # removed by place/admin
 
 
+def effective_status(
+    status: OfferStatus,
+    *,
+    pickup_end: datetime,
+    expires_at: Optional[datetime],
+    now: datetime,
+) -> OfferStatus:
+    """Status an offer has at `now`, once its expiry time has passed"""
+    if status in (OfferStatus.CANCELLED, OfferStatus.SOLD_OUT):
+        return status
+    deadline = expires_at if expires_at is not None else pickup_end
+    return OfferStatus.EXPIRED if now > deadline else status
+
+
 # ---------- domain entity ----------
 
 @dataclass(slots=True)
@@ -100,8 +141,8 @@ class Offer:
     description: str = ""
 
     # pricing
-    original_price: Money = field(default_factory=lambda: Money(Decimal("0.00")))
-    price: Money = field(default_factory=lambda: Money(Decimal("0.00")))
+    original_price: Money = field(default_factory=lambda: Money(0))
+    price: Money = field(default_factory=lambda: Money(0))
 
     # inventory
     quantity_total: int = 1
@@ -123,6 +164,9 @@ class Offer:
     # optional: if you want to auto-expire earlier than pickup_end
     expires_at: Optional[datetime] = None
 
+    # derived from the prices; recomputed by _validate, lazily filled otherwise
+    _discount_percent: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
     # ----- constructors -----
 
     @staticmethod
@@ -166,8 +210,11 @@ class Offer:
 
     def activate(self, *, now: Optional[datetime] = None) -> None:
         self._validate()
-        if self.status in (OfferStatus.CANCELLED, OfferStatus.EXPIRED):
+        now = ensure_tzaware(now or utcnow(), "now")
+        if self.status == OfferStatus.CANCELLED:
             raise NotAvailableError(f"Cannot activate offer in status={self.status}")
+        if self.status == OfferStatus.EXPIRED or self._is_expired(now):
+            raise NotAvailableError(f"Cannot activate offer in status={OfferStatus.EXPIRED}")
         self.status = OfferStatus.ACTIVE
         self._touch(now)
 
@@ -185,20 +232,13 @@ class Offer:
         return self.pickup_start <= now <= self.pickup_end
 
     def is_expired(self, now: datetime) -> bool:
-        now = ensure_tzaware(now, "now")
-        if self.expires_at is not None:
-            return now > self.expires_at
-        return now > self.pickup_end
+        return self._is_expired(ensure_tzaware(now, "now"))
 
     def refresh_time_status(self, *, now: datetime) -> None:
         """
         Call this when reading/serving offers (or via a scheduled job later).
         """
-        now = ensure_tzaware(now, "now")
-        if self.status not in (OfferStatus.CANCELLED, OfferStatus.SOLD_OUT):
-            if self.is_expired(now):
-                self.status = OfferStatus.EXPIRED
-                self._touch(now)
+        self._refresh_time_status(ensure_tzaware(now, "now"))
 
     def can_reserve(self, qty: int, now: datetime) -> bool:
         now = ensure_tzaware(now, "now")
@@ -206,7 +246,7 @@ class Offer:
             return False
         if self.status != OfferStatus.ACTIVE:
             return False
-        if self.is_expired(now):
+        if self._is_expired(now):
             return False
         # You may choose: allow reserve only before pickup_end (even if pickup_start not reached)
         # This allows pre-ordering for a pickup window later today.
@@ -216,13 +256,13 @@ class Offer:
 
     def reserve(self, qty: int, *, now: datetime) -> None:
         now = ensure_tzaware(now, "now")
-        self.refresh_time_status(now=now)
+        self._refresh_time_status(now)
 
         if qty <= 0:
             raise ValidationError("qty must be > 0")
         if self.status != OfferStatus.ACTIVE:
             raise NotAvailableError(f"Offer is not active (status={self.status})")
-        if self.is_expired(now):
+        if self._is_expired(now):
             raise NotAvailableError("Offer is expired")
         if self.quantity_available < qty:
             raise InsufficientQuantityError("Not enough quantity available")
@@ -230,7 +270,7 @@ class Offer:
         self.quantity_available -= qty
         if self.quantity_available == 0:
             self.status = OfferStatus.SOLD_OUT
-        self._touch(now)
+        self.updated_at = now
 
     def release(self, qty: int, *, now: datetime) -> None:
         """
@@ -255,15 +295,28 @@ class Offer:
         """
         Returns integer discount percent vs original price (0..100).
         """
-        if self.original_price.amount == Decimal("0.00"):
-            return 0
-        if self.price.amount >= self.original_price.amount:
-            return 0
-        ratio = (Decimal("1") - (self.price.amount / self.original_price.amount)) * Decimal("100")
-        # round to nearest int
-        return int(ratio.quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+        if self._discount_percent is None:
+            self._discount_percent = self._compute_discount_percent()
+        return self._discount_percent
 
     # ----- internal -----
+    # `now` below is already checked by the public method that calls them
+
+    def _is_expired(self, now: datetime) -> bool:
+        if self.expires_at is not None:
+            return now > self.expires_at
+        return now > self.pickup_end
+
+    def _refresh_time_status(self, now: datetime) -> None:
+        status = effective_status(
+            self.status, pickup_end=self.pickup_end, expires_at=self.expires_at, now=now
+        )
+        if status != self.status:
+            self.status = status
+            self.updated_at = now
+
+    def _compute_discount_percent(self) -> int:
+        return discount_percent(self.price.amount_cents, self.original_price.amount_cents)
 
     def _touch(self, now: Optional[datetime] = None) -> None:
         self.updated_at = ensure_tzaware(now or utcnow(), "now")
@@ -297,15 +350,16 @@ class Offer:
                 raise ValidationError("expires_at cannot be before pickup_start")
 
         # price rules
-        if self.price.amount <= Decimal("0.00"):
+        if self.price.amount_cents <= 0:
             raise ValidationError("price must be > 0")
-        if self.original_price.amount <= Decimal("0.00"):
+        if self.original_price.amount_cents <= 0:
             raise ValidationError("original_price must be > 0")
         if self.price.currency != self.original_price.currency:
             raise ValidationError("price and original_price currency must match")
-        if self.price.amount > self.original_price.amount:
+        if self.price.amount_cents > self.original_price.amount_cents:
             # optional: allow equal, but not higher
             raise ValidationError("price cannot be higher than original_price")
+        self._discount_percent = self._compute_discount_percent()
 
         # normalize lists
         self.tags = [t.strip().lower() for t in self.tags if t and t.strip()]
@@ -1,11 +1,25 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from sqlalchemy import text
 
-from services.catalog.src.core.db import get_engine
+from services.catalog.src.core.db import dispose_engine, get_engine
+from services.catalog.src.core.partitions import get_partition_maintainer
 from services.catalog.src.core.settings import settings
 from services.catalog.src.api.offers import router as offers_router
 
-app = FastAPI(title=settings.app_name)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks"""
+    partition_maintainer = get_partition_maintainer()
+    partition_maintainer.start()
+    yield
+    await partition_maintainer.stop()
+    await dispose_engine()
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
 app.include_router(offers_router)
 
@@ -15,11 +29,10 @@ def health():
 
 
 @app.get("/db/health")
-def db_health():
+async def db_health():
     try:
-        engine = get_engine()
-        with engine.connect() as conn:
-            conn.execute(text("select 1"))
+        async with get_engine().connect() as conn:
+            await conn.execute(text("select 1"))
         return {"db": "ok"}
     except Exception as e:
         return {"db": "error", "detail": str(e)}
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import String, Integer, DateTime, Enum, Numeric, Text
+from sqlalchemy import String, Integer, SmallInteger, DateTime, Enum, Numeric, Text, Computed, Index, text
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -15,7 +15,7 @@ class OfferORM(Base):
     __tablename__ = "offers"
 
     id: Mapped[str] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    place_id: Mapped[str] = mapped_column(UUID(as_uuid=True), nullable=False, index=True)
+    place_id: Mapped[str] = mapped_column(UUID(as_uuid=True), nullable=False)
 
     title: Mapped[str] = mapped_column(String(120), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False, default="")
@@ -27,6 +27,17 @@ class OfferORM(Base):
     original_price_amount: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False)
     original_price_currency: Mapped[str] = mapped_column(String(3), nullable=False, default="RUB")
 
+    # Generated by Postgres from the prices (read-only; same rounding as the domain)
+    discount_percent: Mapped[int] = mapped_column(
+        SmallInteger,
+        Computed(
+            "CASE WHEN price_amount >= original_price_amount THEN 0 "
+            "ELSE round((original_price_amount - price_amount) * 100 / original_price_amount) END",
+            persisted=True,
+        ),
+        nullable=False,
+    )
+
     quantity_total: Mapped[int] = mapped_column(Integer, nullable=False)
     quantity_available: Mapped[int] = mapped_column(Integer, nullable=False)
 
@@ -41,9 +52,21 @@ class OfferORM(Base):
         index=True,
     )
 
-    tags: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False, default=list)
-    allergens: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False, default=list)
-    image_urls: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False, default=list)
+    tags: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False, default=list, server_default="{}")
+    allergens: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False, default=list, server_default="{}")
+    image_urls: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False, default=list, server_default="{}")
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        # Customer list: active offers, soonest pickup_end first; id breaks ties for keyset pages
+        Index(
+            "ix_offers_active_pickup_end_id", "pickup_end", "id",
+            postgresql_where=text("status = 'ACTIVE'"),
+        ),
+        # Partner dashboard: offers of one place, newest first
+        Index("ix_offers_place_created_at_id", "place_id", "created_at", "id"),
+        # Tag filter: tags @> ARRAY[tag]
+        Index("ix_offers_tags_gin", "tags", postgresql_using="gin"),
+    )
@@ -9,7 +9,7 @@ from datetime import datetime
 from enum import Enum
 from uuid import uuid4
 
-from sqlalchemy import String, DateTime, Enum as SQLEnum, Text, Index
+from sqlalchemy import DDL, String, DateTime, Enum as SQLEnum, Text, Index, event, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -26,7 +26,14 @@ class UserAction(str, Enum):
 
 
 class UserHistoryORM(Base):
-    """User activity history database model"""
+    """
+    User activity history database model.
+
+    Partitioned by month of created_at (user_history_YYYY_MM), so each
+    partition's indexes stay small and old months can be detached. Monthly
+    partitions are created ahead of time by core/partitions.py; rows outside
+    them land in user_history_default.
+    """
     __tablename__ = "user_history"
 
     id: Mapped[str] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
@@ -34,21 +41,18 @@ class UserHistoryORM(Base):
     user_id: Mapped[str] = mapped_column(
         UUID(as_uuid=True),
         nullable=False,
-        index=True,
         comment="User who performed the action"
     )
 
     offer_id: Mapped[str] = mapped_column(
         UUID(as_uuid=True),
         nullable=False,
-        index=True,
         comment="Offer related to the action"
     )
 
     action: Mapped[UserAction] = mapped_column(
         SQLEnum(UserAction, name="user_action"),
         nullable=False,
-        index=True,
     )
 
     details: Mapped[str] = mapped_column(
@@ -58,21 +62,31 @@ class UserHistoryORM(Base):
         comment="Additional action details (JSON format future)"
     )
 
+    # Partition key, so part of the primary key
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        nullable=False,
-        default=datetime.utcnow,
-        index=True,
+        primary_key=True,
+        server_default=func.now(),  # set by Postgres, not by the app clock
     )
 
-    # Indexes for common queries
+    # Indexes for common queries (created per partition by Postgres)
     __table_args__ = (
-        Index("idx_user_history_user_id", "user_id"),
         Index("idx_user_history_offer_id", "offer_id"),
         Index("idx_user_history_action", "action"),
         Index("idx_user_history_created_at", "created_at"),
-        Index("idx_user_history_user_created", "user_id", "created_at"),
+        # A user's recent actions first; also serves lookups by user_id alone
+        Index("idx_user_history_user_created", "user_id", text("created_at DESC")),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     def __repr__(self) -> str:
         return f"<UserHistoryORM(user_id={self.user_id}, action={self.action})>"
+
+
+# A partitioned table without partitions rejects every insert: create_all()
+# gets the DEFAULT partition too, monthly ones come from partition maintenance
+event.listen(
+    UserHistoryORM.__table__,
+    "after_create",
+    DDL("CREATE TABLE user_history_default PARTITION OF user_history DEFAULT"),
+)
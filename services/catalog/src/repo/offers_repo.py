@@ -1,112 +1,310 @@
 from __future__ import annotations
 
-from decimal import Decimal
 from datetime import datetime
+from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import DateTime, Row, bindparam, case, func, literal, select, text, tuple_, type_coerce, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from services.catalog.src.domain.offer import Offer, Money
+from services.catalog.src.core.pagination import Cursor
+from services.catalog.src.domain.offer import Offer, Money, OfferStatus
 from services.catalog.src.models.offer import OfferORM
 
 
 def _to_domain(o: OfferORM) -> Offer:
+    # UUID(as_uuid=True) columns already load as UUIDs. The array columns are
+    # handed over as-is; _to_values copies them again on the way back
     return Offer(
-        id=UUID(str(o.id)) if isinstance(o.id, str) else o.id,
-        place_id=UUID(str(o.place_id)) if isinstance(o.place_id, str) else o.place_id,
+        id=o.id,
+        place_id=o.place_id,
         title=o.title,
         description=o.description,
-        price=Money(Decimal(str(o.price_amount)), o.price_currency),
-        original_price=Money(Decimal(str(o.original_price_amount)), o.original_price_currency),
+        # Numeric(12, 2) columns, so the conversion to cents is exact
+        price=Money(int(o.price_amount * 100), o.price_currency),
+        original_price=Money(int(o.original_price_amount * 100), o.original_price_currency),
         quantity_total=o.quantity_total,
         quantity_available=o.quantity_available,
         pickup_start=o.pickup_start,
         pickup_end=o.pickup_end,
         expires_at=o.expires_at,
         status=o.status,
-        tags=list(o.tags or []),
-        allergens=list(o.allergens or []),
-        image_urls=list(o.image_urls or []),
+        tags=o.tags,
+        allergens=o.allergens,
+        image_urls=o.image_urls,
         created_at=o.created_at,
         updated_at=o.updated_at,
     )
 
 
-def _apply_domain(o: OfferORM, d: Offer) -> None:
-    o.place_id = d.place_id
-    o.title = d.title
-    o.description = d.description
+def _to_values(d: Offer) -> dict:
+    """Column values of a domain Offer (discount_percent is generated by Postgres)"""
+    return {
+        "id": d.id,
+        "place_id": d.place_id,
+        "title": d.title,
+        "description": d.description,
+        "price_amount": d.price.amount,
+        "price_currency": d.price.currency,
+        "original_price_amount": d.original_price.amount,
+        "original_price_currency": d.original_price.currency,
+        "quantity_total": d.quantity_total,
+        "quantity_available": d.quantity_available,
+        "pickup_start": d.pickup_start,
+        "pickup_end": d.pickup_end,
+        "expires_at": d.expires_at,
+        "status": d.status,
+        "tags": list(d.tags),
+        "allergens": list(d.allergens),
+        "image_urls": list(d.image_urls),
+        "created_at": d.created_at,
+        "updated_at": d.updated_at,
+    }
 
-    o.price_amount = d.price.amount
-    o.price_currency = d.price.currency
-    o.original_price_amount = d.original_price.amount
-    o.original_price_currency = d.original_price.currency
 
-    o.quantity_total = d.quantity_total
-    o.quantity_available = d.quantity_available
+# Columns save() overwrites when the offer already exists (id and created_at never change)
+_UPSERT_COLUMNS = tuple(
+    c.name for c in OfferORM.__table__.columns
+    if c.name not in ("id", "created_at") and c.computed is None
+)
 
-    o.pickup_start = d.pickup_start
-    o.pickup_end = d.pickup_end
-    o.expires_at = d.expires_at
 
-    o.status = d.status
-    o.tags = list(d.tags)
-    o.allergens = list(d.allergens)
-    o.image_urls = list(d.image_urls)
+# Columns behind the customer list view (OfferSummaryOut). Description, tags,
+# allergens and all but the first image are left in the database.
+_SUMMARY_COLUMNS = (
+    OfferORM.id,
+    OfferORM.place_id,
+    OfferORM.title,
+    OfferORM.price_amount,
+    OfferORM.price_currency,
+    OfferORM.original_price_amount,
+    OfferORM.original_price_currency,
+    OfferORM.discount_percent,
+    OfferORM.quantity_total,
+    OfferORM.quantity_available,
+    OfferORM.pickup_start,
+    OfferORM.pickup_end,
+    OfferORM.expires_at,
+    OfferORM.status,
+    OfferORM.image_urls[1].label("image_url"),  # Postgres arrays are 1-based
+)
 
-    o.created_at = d.created_at
-    o.updated_at = d.updated_at
+
+# SQL twin of domain.offer.effective_status: status at :now, EXPIRED once time
+# ran out. Built once (building the CASE costs ~0.2 ms); pass {"now": ...} on execute
+_EFFECTIVE_STATUS = type_coerce(
+    case(
+        # == rather than in_(): an expanding IN is re-rendered on every execute
+        (OfferORM.status == OfferStatus.CANCELLED, OfferORM.status),
+        (OfferORM.status == OfferStatus.SOLD_OUT, OfferORM.status),
+        (
+            func.coalesce(OfferORM.expires_at, OfferORM.pickup_end)
+            < bindparam("now", type_=DateTime(timezone=True)),
+            literal(OfferStatus.EXPIRED, OfferORM.status.type),
+        ),
+        else_=OfferORM.status,
+    ),
+    OfferORM.status.type,
+).label("status")
+
+# Every offers column, with status replaced by the effective status at :now
+_SELECT_CURRENT = select(*(
+    _EFFECTIVE_STATUS if c.name == "status" else c for c in OfferORM.__table__.columns
+))
+
+# _SUMMARY_COLUMNS with the effective status at :now
+_CURRENT_SUMMARY_COLUMNS = tuple(
+    _EFFECTIVE_STATUS if c is OfferORM.status else c for c in _SUMMARY_COLUMNS
+)
+
+
+# Partial index over ACTIVE offers; its planner row count sizes the customer list
+_ACTIVE_INDEX = "ix_offers_active_pickup_end_id"
+
+
+def _active_filter(now: datetime) -> tuple:
+    # Matches ix_offers_active_pickup_end_id
+    return (
+        OfferORM.status == OfferStatus.ACTIVE,
+        func.coalesce(OfferORM.expires_at, OfferORM.pickup_end) >= now,
+    )
 
 
 class OffersRepo:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def list_active(self, *, now: datetime, limit: int = 50, offset: int = 0) -> list[Offer]:
-        stmt = (
-            select(OfferORM)
-            .order_by(OfferORM.pickup_end.asc())
-            .limit(limit)
-            .offset(offset)
+    async def list_active(
+        self,
+        *,
+        now: datetime,
+        limit: int = 50,
+        cursor: Cursor | None = None,
+        active_only: bool = True,
+        tag: str | None = None,
+    ) -> Sequence[Row]:
+        """
+        Get a page of offer summary rows (customer list view), soonest pickup_end first.
+        `cursor` is the (pickup_end, id) of the last row of the previous page.
+        Rows carry the effective status at `now`. With `tag`, only offers
+        tagged with it (tags are stored lowercase).
+        """
+        if active_only:
+            # The filter leaves only offers that are ACTIVE at now
+            stmt = select(*_SUMMARY_COLUMNS).where(*_active_filter(now))
+        else:
+            stmt = select(*_CURRENT_SUMMARY_COLUMNS)
+        if cursor is not None:
+            stmt = stmt.where(tuple_(OfferORM.pickup_end, OfferORM.id) > cursor)
+        if tag is not None:
+            # @> rather than = ANY(tags): only containment can use ix_offers_tags_gin
+            stmt = stmt.where(OfferORM.tags.contains([tag]))
+        stmt = stmt.order_by(OfferORM.pickup_end.asc(), OfferORM.id.asc()).limit(limit)
+        return (await self.db.execute(stmt, {"now": now})).all()
+
+    async def count_estimate(self, *, active_only: bool = True) -> int | None:
+        """
+        Approximate number of offers list_active pages through, in O(1).
+
+        Reads the planner row count from pg_class, which (auto)ANALYZE and VACUUM
+        keep current; None if the table has not been analyzed yet. With
+        active_only it counts ACTIVE offers, including ones whose time ran out
+        but whose expiry is not stored yet.
+        """
+        rel = _ACTIVE_INDEX if active_only else OfferORM.__tablename__
+        estimate = await self.db.scalar(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:rel AS regclass)"),
+            {"rel": rel},
         )
-        rows = self.db.execute(stmt).scalars().all()
-        return [_to_domain(r) for r in rows]
+        return estimate if estimate is not None and estimate >= 0 else None
+
+    async def list_by_place(
+        self,
+        place_id: UUID,
+        *,
+        now: datetime,
+        limit: int = 50,
+        cursor: Cursor | None = None,
+    ) -> Sequence[Row]:
+        """
+        Get a page of a place's offers (for partner dashboard), newest first.
 
-    def list_by_place(self, place_id: UUID, *, limit: int = 50, offset: int = 0) -> list[Offer]:
-        """Get all offers for a specific place (for partner dashboard)"""
+        Returns plain rows of the offers table, with the effective status at
+        `now`: the page is only displayed, so no ORM entities or domain Offers
+        are built. `cursor` is the (created_at, id) of the last offer of the
+        previous page.
+        """
+        stmt = _SELECT_CURRENT.where(OfferORM.place_id == place_id)
+        if cursor is not None:
+            stmt = stmt.where(tuple_(OfferORM.created_at, OfferORM.id) < cursor)
+        stmt = stmt.order_by(OfferORM.created_at.desc(), OfferORM.id.desc()).limit(limit)
+        return (await self.db.execute(stmt, {"now": now})).all()
+
+    async def count_by_place(self, place_id: UUID) -> int:
+        """Count all offers of a specific place"""
+        stmt = select(func.count()).select_from(OfferORM).where(OfferORM.place_id == place_id)
+        return await self.db.scalar(stmt) or 0
+
+    async def get(self, offer_id: UUID) -> Offer | None:
+        row = await self.db.get(OfferORM, offer_id)
+        return _to_domain(row) if row else None
+
+    async def get_row(self, offer_id: UUID, *, now: datetime) -> Row | None:
+        """
+        Get an offer as a plain offers table row, with the effective status at
+        `now` (computed in the query; nothing is written). For display only.
+        """
+        stmt = _SELECT_CURRENT.where(OfferORM.id == offer_id)
+        return (await self.db.execute(stmt, {"now": now})).one_or_none()
+
+    async def save(self, offer: Offer) -> Offer:
+        """Insert or update the offer in one statement (INSERT ... ON CONFLICT DO UPDATE)"""
+        stmt = insert(OfferORM).values(_to_values(offer))
         stmt = (
-            select(OfferORM)
-            .where(OfferORM.place_id == place_id)
-            .order_by(OfferORM.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+            stmt.on_conflict_do_update(
+                index_elements=[OfferORM.id],
+                set_={name: stmt.excluded[name] for name in _UPSERT_COLUMNS},
+            )
+            .returning(OfferORM)
+            .execution_options(populate_existing=True)
+        )
+        row = (await self.db.scalars(stmt)).one()
+        return _to_domain(row)
+
+    async def update(self, offer_id: UUID, place_id: UUID, values: dict, *, now: datetime) -> Offer | None:
+        """
+        Atomically apply a partial edit (column -> new value) to an editable
+        (not cancelled, not past its time) offer of the place, if the result
+        still satisfies the domain rules.
+        Returns the updated offer, or None if nothing was updated.
+        """
+        table = OfferORM.__table__
+
+        def new(name: str):
+            # Column value after the update, for the guards below
+            if name in values:
+                return literal(values[name], table.c[name].type)
+            return table.c[name]
+
+        stmt = update(OfferORM).where(
+            OfferORM.id == offer_id,
+            OfferORM.place_id == place_id,
+            OfferORM.status.notin_((OfferStatus.CANCELLED, OfferStatus.EXPIRED)),
+            # Past its time an offer is expired, whatever the stored status says
+            func.coalesce(OfferORM.expires_at, OfferORM.pickup_end) >= now,
+            new("price_amount") <= new("original_price_amount"),
+            new("pickup_end") > new("pickup_start"),
+            (OfferORM.expires_at.is_(None)) | (OfferORM.expires_at >= new("pickup_start")),
         )
-        rows = self.db.execute(stmt).scalars().all()
-        return [_to_domain(r) for r in rows]
+        values = dict(values, updated_at=now)
 
-    def count_all(self) -> int:
-        """Count all offers"""
-        from sqlalchemy import func
-        return self.db.query(func.count(OfferORM.id)).scalar() or 0
+        if "quantity_total" in values:
+            # Keep what is already reserved reserved
+            reserved = OfferORM.quantity_total - OfferORM.quantity_available
+            stmt = stmt.where(reserved <= values["quantity_total"])
+            values["quantity_available"] = values["quantity_total"] - reserved
 
-    def get(self, offer_id: UUID) -> Offer | None:
-        row = self.db.get(OfferORM, offer_id)
+        if values.get("status") == OfferStatus.PAUSED:
+            # Only an ACTIVE offer pauses; others keep their status
+            paused = literal(OfferStatus.PAUSED, OfferORM.status.type)
+            values["status"] = case((OfferORM.status == OfferStatus.ACTIVE, paused), else_=OfferORM.status)
+
+        stmt = stmt.values(values).returning(OfferORM).execution_options(populate_existing=True)
+        row = (await self.db.scalars(stmt)).one_or_none()
         return _to_domain(row) if row else None
 
-    def save(self, offer: Offer) -> Offer:
-        row = self.db.get(OfferORM, offer.id)
-        if row is None:
-            row = OfferORM(id=offer.id)
-            self.db.add(row)
-        _apply_domain(row, offer)
-        self.db.flush()
-        return _to_domain(row)
-    def delete(self, offer_id: UUID) -> bool:
+    async def reserve(self, offer_id: UUID, qty: int, *, now: datetime) -> Offer | None:
+        """
+        Atomically take qty from an active, unexpired offer with enough stock.
+        Returns the updated offer, or None if nothing was reserved.
+        """
+        remaining = OfferORM.quantity_available - qty
+        sold_out = literal(OfferStatus.SOLD_OUT, OfferORM.status.type)
+        stmt = (
+            update(OfferORM)
+            .where(
+                OfferORM.id == offer_id,
+                OfferORM.status == OfferStatus.ACTIVE,
+                OfferORM.quantity_available >= qty,
+                func.coalesce(OfferORM.expires_at, OfferORM.pickup_end) >= now,
+            )
+            .values(
+                quantity_available=remaining,
+                status=case((remaining == 0, sold_out), else_=OfferORM.status),
+                updated_at=now,
+            )
+            .returning(OfferORM)
+            .execution_options(populate_existing=True)
+        )
+        row = (await self.db.scalars(stmt)).one_or_none()
+        return _to_domain(row) if row else None
+
+    async def delete(self, offer_id: UUID) -> bool:
         """Delete an offer by ID. Returns True if deleted, False if not found."""
-        row = self.db.get(OfferORM, offer_id)
+        row = await self.db.get(OfferORM, offer_id)
         if row is None:
             return False
-        self.db.delete(row)
-        self.db.flush()
+        await self.db.delete(row)
+        await self.db.flush()
         return True
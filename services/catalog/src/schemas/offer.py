@@ -3,7 +3,7 @@ from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 # ========== Response Schemas ==========
@@ -42,12 +42,40 @@ class OfferOut(BaseModel):
         from_attributes = True
 
 
+class OfferSummaryOut(BaseModel):
+    """Offer card for the customer list; full details come from GET /offers/{id}"""
+    id: UUID
+    place_id: UUID
+    title: str
+
+    price: MoneyOut
+    original_price: MoneyOut
+    discount_percent: int
+
+    quantity_total: int
+    quantity_available: int
+
+    pickup_start: datetime
+    pickup_end: datetime
+
+    status: str
+    image_url: Optional[str] = None  # first image only
+
+
+class OfferSummaryListOut(BaseModel):
+    """Paginated customer list response"""
+    offers: list[OfferSummaryOut]
+    total_estimate: Optional[int] = None  # approximate; first page only
+    limit: int
+    next_cursor: Optional[str] = None  # pass as ?cursor= for the next page; None on the last
+
+
 class OfferListOut(BaseModel):
     """Paginated list response"""
     offers: list[OfferOut]
-    total: int
+    total: Optional[int] = None  # first page only
     limit: int
-    offset: int
+    next_cursor: Optional[str] = None  # pass as ?cursor= for the next page; None on the last
 
 
 class ReservationOut(BaseModel):
@@ -106,6 +134,47 @@ class OfferUpdate(BaseModel):
 
     status: Optional[str] = None  # "active", "paused", "cancelled"
 
+    # Rules that need only the request are checked here, before the database;
+    # the ones that also need the stored offer are part of the UPDATE
+
+    @field_validator('title')
+    @classmethod
+    def validate_title(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None and len(v.strip()) < 3:
+            raise ValueError("title must be at least 3 characters")
+        return v
+
+    @field_validator('pickup_start', 'pickup_end')
+    @classmethod
+    def validate_tzaware(cls, v: Optional[datetime]) -> Optional[datetime]:
+        if v is not None and (v.tzinfo is None or v.tzinfo.utcoffset(v) is None):
+            raise ValueError("must be timezone-aware (UTC recommended)")
+        return v
+
+    @field_validator('tags', 'allergens')
+    @classmethod
+    def normalize_labels(cls, v: Optional[list[str]]) -> Optional[list[str]]:
+        return None if v is None else [t.strip().lower() for t in v if t and t.strip()]
+
+    @field_validator('image_urls')
+    @classmethod
+    def normalize_urls(cls, v: Optional[list[str]]) -> Optional[list[str]]:
+        return None if v is None else [u.strip() for u in v if u and u.strip()]
+
+    @model_validator(mode='after')
+    def validate_pairs(self) -> "OfferUpdate":
+        if (
+            self.price_amount is not None and self.original_price_amount is not None
+            and self.price_amount > self.original_price_amount
+        ):
+            raise ValueError("price cannot be higher than original_price")
+        if (
+            self.pickup_start is not None and self.pickup_end is not None
+            and self.pickup_end <= self.pickup_start
+        ):
+            raise ValueError("pickup_end must be after pickup_start")
+        return self
+
 
 class OfferReserve(BaseModel):
     """Reserve quantity from an offer - user only"""
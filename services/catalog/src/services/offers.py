@@ -4,32 +4,75 @@ Orchestrates domain logic, repository operations, and validation.
 """
 from __future__ import annotations
 
+from datetime import datetime
+from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from services.catalog.src.core.list_cache import get_offer_list_cache
+from services.catalog.src.core.pagination import Cursor
 from services.catalog.src.domain.offer import (
     Offer, Money, OfferStatus,
-    ValidationError, NotAvailableError,
-    utcnow
+    ValidationError, NotAvailableError, InsufficientQuantityError,
+    effective_status, utcnow
 )
 from services.catalog.src.repo.offers_repo import OffersRepo
 from services.catalog.src.schemas.offer import OfferCreate, OfferUpdate
 
 
+# OfferUpdate.status -> stored status ("paused" only pauses an ACTIVE offer)
+_STATUS_CHANGES = {
+    "active": OfferStatus.ACTIVE,
+    "paused": OfferStatus.PAUSED,
+    "cancelled": OfferStatus.CANCELLED,
+}
+
+
+def _apply_update(offer: Offer, data: OfferUpdate, now: datetime) -> None:
+    """Apply an edit to the domain offer, raising the domain error it violates"""
+    if data.title is not None:
+        offer.title = data.title
+    if data.description is not None:
+        offer.description = data.description
+
+    if data.price_amount is not None:
+        offer.price = Money.from_decimal(data.price_amount, offer.price.currency)
+    if data.original_price_amount is not None:
+        offer.original_price = Money.from_decimal(data.original_price_amount, offer.original_price.currency)
+
+    if data.quantity_total is not None:
+        reserved = offer.quantity_total - offer.quantity_available
+        if data.quantity_total < reserved:
+            raise ValidationError(f"Cannot set quantity_total below reserved amount ({reserved})")
+        offer.quantity_available = data.quantity_total - reserved
+        offer.quantity_total = data.quantity_total
+
+    if data.pickup_start is not None:
+        offer.pickup_start = data.pickup_start
+    if data.pickup_end is not None:
+        offer.pickup_end = data.pickup_end
+
+    if data.status == "active":
+        offer.activate(now=now)
+    offer._validate()
+
+
 class OfferService:
     """
     Service layer for offer operations.
     Handles business use cases, transactions, and domain coordination.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.repo = OffersRepo(db)
+        self.list_cache = get_offer_list_cache()
 
     # ========== Partner Operations ==========
 
-    def create_offer(self, place_id: UUID, data: OfferCreate) -> Offer:
+    async def create_offer(self, place_id: UUID, data: OfferCreate) -> Offer:
         """
         Create a new offer for a partner's place.
 
@@ -49,8 +92,8 @@ class OfferService:
             place_id=place_id,
             title=data.title,
             description=data.description,
-            price=Money(data.price_amount, data.price_currency),
-            original_price=Money(data.original_price_amount, data.original_price_currency),
+            price=Money.from_decimal(data.price_amount, data.price_currency),
+            original_price=Money.from_decimal(data.original_price_amount, data.original_price_currency),
             quantity_total=data.quantity_total,
             pickup_start=data.pickup_start,
             pickup_end=data.pickup_end,
@@ -63,12 +106,13 @@ class OfferService:
             offer.expires_at = data.expires_at
 
         # Save to database
-        saved = self.repo.save(offer)
-        self.db.commit()
+        saved = await self.repo.save(offer)
+        await self.db.commit()
+        self.list_cache.invalidate()
 
         return saved
 
-    def update_offer(self, offer_id: UUID, place_id: UUID, data: OfferUpdate) -> Offer:
+    async def update_offer(self, offer_id: UUID, place_id: UUID, data: OfferUpdate) -> Offer:
         """
         Update an existing offer.
 
@@ -77,72 +121,39 @@ class OfferService:
         - Cannot update cancelled or expired offers
         - Partial updates supported
         """
-        offer = self.repo.get(offer_id)
-        if not offer:
-            raise NotAvailableError(f"Offer {offer_id} not found")
-
-        # Authorization check: ensure partner owns this offer
-        if offer.place_id != place_id:
-            raise NotAvailableError("You don't have permission to update this offer")
-
-        # Cannot edit cancelled/expired offers
-        if offer.status in (OfferStatus.CANCELLED, OfferStatus.EXPIRED):
-            raise NotAvailableError(f"Cannot edit offer in status {offer.status}")
-
         now = utcnow()
+        values = data.model_dump(exclude_unset=True, exclude_none=True)
+        status = values.pop("status", None)
+        if status in _STATUS_CHANGES:
+            values["status"] = _STATUS_CHANGES[status]
+
+        # One conditional UPDATE checks ownership and the domain rules and writes
+        updated = await self.repo.update(offer_id, place_id, values, now=now)
+        if updated is None:
+            # Nothing updated - let the domain rules say why
+            offer = await self.repo.get(offer_id)
+            if not offer:
+                raise NotAvailableError(f"Offer {offer_id} not found")
+            if offer.place_id != place_id:
+                raise NotAvailableError("You don't have permission to update this offer")
+            # Same rule as the UPDATE's guard, on the stored times before the edit
+            status = effective_status(
+                offer.status, pickup_end=offer.pickup_end, expires_at=offer.expires_at, now=now
+            )
+            if status != OfferStatus.CANCELLED and offer.is_expired(now):
+                status = OfferStatus.EXPIRED  # also when sold out
+            if status in (OfferStatus.CANCELLED, OfferStatus.EXPIRED):
+                raise NotAvailableError(f"Cannot edit offer in status {status.value}")
+            _apply_update(offer, data, now)
+            # The offer changed concurrently since the UPDATE
+            raise NotAvailableError("Offer was modified concurrently, try again")
 
-        # Apply updates (only fields that are provided)
-        if data.title is not None:
-            offer.title = data.title
-        if data.description is not None:
-            offer.description = data.description
-
-        # Update pricing
-        if data.price_amount is not None:
-            offer.price = Money(data.price_amount, offer.price.currency)
-        if data.original_price_amount is not None:
-            offer.original_price = Money(data.original_price_amount, offer.original_price.currency)
-
-        if data.quantity_total is not None:
-            # Ensure we don't set total below what's already reserved
-            reserved = offer.quantity_total - offer.quantity_available
-            if data.quantity_total < reserved:
-                raise ValidationError(f"Cannot set quantity_total below reserved amount ({reserved})")
-            # Adjust available proportionally
-            offer.quantity_available = data.quantity_total - reserved
-            offer.quantity_total = data.quantity_total
-
-        if data.pickup_start is not None:
-            offer.pickup_start = data.pickup_start
-        if data.pickup_end is not None:
-            offer.pickup_end = data.pickup_end
-
-        if data.tags is not None:
-            offer.tags = data.tags
-        if data.allergens is not None:
-            offer.allergens = data.allergens
-        if data.image_urls is not None:
-            offer.image_urls = data.image_urls
-
-        # Handle status changes
-        if data.status is not None:
-            if data.status == "active":
-                offer.activate(now=now)
-            elif data.status == "paused":
-                offer.pause(now=now)
-            elif data.status == "cancelled":
-                offer.cancel(now=now)
-
-        # Re-validate and save
-        offer._validate()
-        offer._touch(now)
-
-        saved = self.repo.save(offer)
-        self.db.commit()
+        await self.db.commit()
+        self.list_cache.invalidate()
 
-        return saved
+        return updated
 
-    def delete_offer(self, offer_id: UUID, place_id: UUID) -> bool:
+    async def delete_offer(self, offer_id: UUID, place_id: UUID) -> bool:
         """
         Delete an offer (soft delete in future, hard delete for now).
 
@@ -150,7 +161,7 @@ class OfferService:
         - Only the owner can delete
         - Cannot delete if there are active reservations (future enhancement)
         """
-        offer = self.repo.get(offer_id)
+        offer = await self.repo.get(offer_id)
         if not offer:
             return False
 
@@ -166,61 +177,67 @@ class OfferService:
                 "Cancel the offer instead."
             )
 
-        deleted = self.repo.delete(offer_id)
-        self.db.commit()
+        deleted = await self.repo.delete(offer_id)
+        await self.db.commit()
+        self.list_cache.invalidate()
 
         return deleted
 
-    def get_partner_offers(
+    async def get_partner_offers(
         self,
         place_id: UUID,
         limit: int = 50,
-        offset: int = 0
-    ) -> list[Offer]:
-        """Get all offers for a partner's place"""
-        return self.repo.list_by_place(place_id, limit=limit, offset=offset)
+        cursor: Cursor | None = None,
+    ) -> tuple[Sequence[Row], Cursor | None]:
+        """
+        Get a page of a partner's offers, as offers table rows, and the cursor
+        of the next page (None on the last)
+        """
+        rows = await self.repo.list_by_place(place_id, now=utcnow(), limit=limit, cursor=cursor)
+        next_cursor = (rows[-1].created_at, rows[-1].id) if len(rows) == limit else None
+        return rows, next_cursor
+
+    async def count_partner_offers(self, place_id: UUID) -> int:
+        """Count all offers of a partner's place (for pagination totals)"""
+        return await self.repo.count_by_place(place_id)
 
     # ========== User Operations ==========
 
-    def list_offers(
+    async def list_offers(
         self,
         limit: int = 50,
-        offset: int = 0,
-        active_only: bool = True
-    ) -> list[Offer]:
+        cursor: Cursor | None = None,
+        active_only: bool = True,
+        tag: str | None = None,
+    ) -> tuple[list[dict], int | None, Cursor | None]:
         """
-        List offers for customers.
+        List offers for customers, as summary rows.
+
+        Returns the rows, an estimate of the total across pages (first page
+        without a tag only, None otherwise) and the cursor of the next page
+        (None on the last page).
 
         Business rules:
         - Only show ACTIVE offers by default
-        - Refresh time-based statuses (expire old offers)
+        - Statuses are as of now (offers past their time show as expired)
         - Sort by pickup_end (soonest first)
         """
-        now = utcnow()
-        offers = self.repo.list_active(now=now, limit=limit, offset=offset)
-
-        # Refresh statuses and filter
-        result = []
-        for offer in offers:
-            offer.refresh_time_status(now=now)
-            if not active_only or offer.status == OfferStatus.ACTIVE:
-                result.append(offer)
-
-        # Save any status changes
-        self.db.commit()
-
-        return result
-
-    def get_offer(self, offer_id: UUID) -> Offer | None:
-        """Get a single offer by ID"""
-        offer = self.repo.get(offer_id)
-        if offer:
-            now = utcnow()
-            offer.refresh_time_status(now=now)
-            self.db.commit()
-        return offer
-
-    def reserve_offer(self, offer_id: UUID, quantity: int, user_id: UUID) -> Offer:
+        rows = await self.repo.list_active(
+            now=utcnow(), limit=limit, cursor=cursor, active_only=active_only, tag=tag
+        )
+
+        total_estimate = None
+        if cursor is None and tag is None:
+            total_estimate = await self.repo.count_estimate(active_only=active_only)
+        next_cursor = (rows[-1].pickup_end, rows[-1].id) if len(rows) == limit else None
+
+        return [row._asdict() for row in rows], total_estimate, next_cursor
+
+    async def get_offer(self, offer_id: UUID) -> Row | None:
+        """Get a single offer by ID, as an offers table row, with its status as of now"""
+        return await self.repo.get_row(offer_id, now=utcnow())
+
+    async def reserve_offer(self, offer_id: UUID, quantity: int, user_id: UUID) -> Offer:
         """
         Reserve quantity from an offer (for a user/customer).
 
@@ -236,26 +253,24 @@ class OfferService:
         - Handle reservation release if payment fails
         """
         now = utcnow()
-
-        offer = self.repo.get(offer_id)
-        if not offer:
-            raise NotAvailableError(f"Offer {offer_id} not found")
-
-        # Domain logic handles all validation
-        try:
+        if quantity <= 0:
+            raise ValidationError("qty must be > 0")
+
+        # One conditional UPDATE: concurrent reservations cannot oversell
+        reserved = await self.repo.reserve(offer_id, quantity, now=now)
+        if reserved is None:
+            # Nothing reserved - let the domain rules say why
+            offer = await self.repo.get(offer_id)
+            if not offer:
+                raise NotAvailableError(f"Offer {offer_id} not found")
             offer.reserve(quantity, now=now)
-        except (ValidationError, NotAvailableError, InsufficientQuantityError) as e:
-            raise  # Re-raise domain errors as-is
-
-        # Save the updated offer
-        saved = self.repo.save(offer)
-        self.db.commit()
-
-        return saved
-
-    def count_offers(self) -> int:
-        """Count total offers in system"""
-        return self.repo.count_all()
+            # Stock was taken by a concurrent reservation since the UPDATE
+            raise InsufficientQuantityError("Not enough quantity available")
 
+        await self.db.commit()
+        # Only a sell-out changes the listed offers; quantity_available may lag by the TTL
+        if reserved.status == OfferStatus.SOLD_OUT:
+            self.list_cache.invalidate()
 
+        return reserved
 
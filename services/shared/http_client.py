@@ -8,20 +8,29 @@ from services.shared.exceptions import ExternalServiceError
 
 
 class ServiceHTTPClient:
-    """HTTP client for inter-service communication"""
+    """
+    HTTP client for inter-service communication
+
+    Keeps one connection pool per instance, so repeated calls reuse
+    keep-alive connections instead of reconnecting every time. Create it
+    once (e.g. at startup) and close() it on shutdown.
+    """
 
     def __init__(self, service_url: str, timeout: float = 5.0):
         self.service_url = service_url
         self.timeout = timeout
+        self._client = httpx.Client(
+            base_url=service_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
 
     def get(self, endpoint: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Make GET request to service"""
         try:
-            url = f"{self.service_url}{endpoint}"
-            with httpx.Client() as client:
-                response = client.get(url, headers=headers, timeout=self.timeout)
-                response.raise_for_status()
-                return response.json()
+            response = self._client.get(endpoint, headers=headers)
+            response.raise_for_status()
+            return response.json()
         except httpx.HTTPError as e:
             raise ExternalServiceError(f"Failed to call {self.service_url}: {str(e)}")
 
@@ -33,14 +42,22 @@ class ServiceHTTPClient:
     ) -> Dict[str, Any]:
         """Make POST request to service"""
         try:
-            url = f"{self.service_url}{endpoint}"
-            with httpx.Client() as client:
-                response = client.post(url, json=data, headers=headers, timeout=self.timeout)
-                response.raise_for_status()
-                return response.json()
+            response = self._client.post(endpoint, json=data, headers=headers)
+            response.raise_for_status()
+            return response.json()
         except httpx.HTTPError as e:
             raise ExternalServiceError(f"Failed to call {self.service_url}: {str(e)}")
 
+    def close(self) -> None:
+        """Close pooled connections"""
+        self._client.close()
+
+    def __enter__(self) -> "ServiceHTTPClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def validate_token(self, token: str) -> Dict[str, Any]:
         """
         Call auth service to validate JWT token